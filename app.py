@@ -1,25 +1,33 @@
+from __future__ import annotations
+
 import streamlit as st
 import pandas as pd
 import numpy as np 
 import os
-import matplotlib.pyplot as plt
+import io
+import json
+import threading
+import pyarrow as pa
 from datetime import datetime
-import seaborn as sns
 
 # Importar tus módulos personalizados
 from data_cleaner import DataCleaner
-from models import Registro, Proyecto, Area, Equipo, Indicadores 
-from visualizador_dinamico import generar_graficos_dinamicos 
+from models import Indicadores 
 
 # --- Configuración de la Página ---
 # Establece la configuración de la página de Streamlit
 st.set_page_config(layout="wide", page_title="Análisis Nualart (Directo)")
 
+# Fecha de generación del reporte: se fija una vez por sesión, así los reruns no cambian
+# las leyendas de la página.
+if "fecha_generacion" not in st.session_state:
+    st.session_state.fecha_generacion = datetime.now()
+
 # --- Título ---
 # Muestra el título principal de la aplicación.
 st.title("Análisis de Proyectos Nualart")
 # Muestra una leyenda con la fecha y hora de generación del reporte.
-st.caption(f"Generado: {datetime.now().strftime('%A, %d de %B de %Y, %H:%M')} - Temuco, Chile")
+st.caption(f"Generado: {st.session_state.fecha_generacion.strftime('%A, %d de %B de %Y, %H:%M')} - Temuco, Chile")
 st.markdown("---")
 
 # --- PASO 0: Datos Originales (Vista Previa) ---
@@ -27,19 +35,63 @@ st.markdown("---")
 st.header("0. Datos Originales")
 default_file_path = "dataset_con_nulos_outliers.csv"
 df_original = None
+
+# Tipos de las columnas del CSV original. Los costos y avances se mantienen en doble
+# precisión para no alterar los valores mostrados; las columnas de texto repetitivo
+# se leen como categorías.
+ESQUEMA_CSV_ORIGINAL = {
+    'id': 'int32[pyarrow]',
+    'proyecto': 'category',
+    'area': 'category',
+    'equipo': 'category',
+    'costo_estimado': 'float64[pyarrow]',
+    'costo_real': 'float64[pyarrow]',
+    'avance_estimado': 'float64[pyarrow]',
+    'avance_real': 'float64[pyarrow]',
+    'cantidad_trabajadores': 'int32[pyarrow]',
+}
+
+@st.cache_data(max_entries=1)
+def cargar_datos_originales(filepath: str, mtime: float) -> tuple[pd.DataFrame, pd.DataFrame, pa.Table]:
+    """
+    Carga el CSV original y calcula su resumen de nulos una sola vez por versión del archivo.
+    Solo se conserva la versión más reciente: al cambiar el `mtime` la entrada anterior se descarta.
+
+    filepath (str): Ruta al archivo CSV original.
+    mtime (float): Fecha de modificación del archivo; forma parte de la clave del caché
+                   para que se invalide cuando el archivo cambia.
+
+    tuple[pd.DataFrame, pd.DataFrame, pa.Table]:
+            - DataFrame original.
+            - Tabla ('Cantidad de Nulos') de las columnas que tienen al menos un nulo,
+              ya lista para mostrarse.
+            - Vista previa (primeras filas) ya convertida a tabla Arrow para `st.table`.
+    """
+    # El motor pyarrow parsea las columnas en paralelo y las deja en buffers Arrow.
+    # Con el esquema explícito no se infieren tipos ni se leen columnas que no se usan.
+    df = pd.read_csv(
+        filepath,
+        engine="pyarrow",
+        dtype_backend="pyarrow",
+        dtype=ESQUEMA_CSV_ORIGINAL,
+        usecols=list(ESQUEMA_CSV_ORIGINAL),
+    )
+    nulos = df.isna().sum().loc[lambda conteo: conteo > 0].to_frame(name='Cantidad de Nulos') # Conteo y filtro en una sola expresión.
+    vista_previa = pa.Table.from_pandas(df.head(), preserve_index=False)
+    return df, nulos, vista_previa
+
 if os.path.exists(default_file_path):
     try:
-        # Lee el archivo CSV original.
-        df_original = pd.read_csv(default_file_path)
-        # Muestra las primeras filas del DataFrame original.
-        st.dataframe(df_original.head(), height=180)
+        # Lee el archivo CSV original (cacheado entre reruns de Streamlit).
+        df_original, null_summary_original, vista_previa_original = cargar_datos_originales(default_file_path, os.path.getmtime(default_file_path))
+        # Muestra las primeras filas del DataFrame original (tabla Arrow precalculada).
+        # Es una vista estática de pocas filas: st.table la envía como HTML sin la grilla interactiva.
+        st.table(vista_previa_original)
 
         # Muestra un resumen de los valores nulos en el DataFrame original dentro de un expander.
-        null_summary_original = df_original.isnull().sum()
-        null_summary_original = null_summary_original[null_summary_original > 0]
         if not null_summary_original.empty:
             with st.expander("Ver Resumen de Valores Nulos en Datos Originales", expanded=False):
-                st.dataframe(null_summary_original.to_frame(name='Cantidad de Nulos'), height=150)
+                st.dataframe(null_summary_original, height=150)
         else:
             st.info("El dataset original no presenta valores nulos.")
 
@@ -55,11 +107,52 @@ st.markdown("---")
 # Sección dedicada al proceso de limpieza de datos y visualización de sus resultados.
 st.header("1. Proceso y Resultados de Limpieza de Datos")
 
-@st.cache_data
+# Tipos NumPy de las columnas numéricas para la limpieza (los mismos que se inferirían),
+# de modo que DataCleaner no tenga que inferirlos. Las columnas de texto se infieren
+# como texto normal porque la limpieza puede escribir valores nuevos en ellas.
+ESQUEMA_CSV_LIMPIEZA = {
+    'id': 'int64',
+    'costo_estimado': 'float64',
+    'costo_real': 'float64',
+    'avance_estimado': 'float64',
+    'avance_real': 'float64',
+    'cantidad_trabajadores': 'float64',
+}
+
+def _rutas_cache_limpieza(filepath: str) -> tuple[str, str]:
+    """
+    Devuelve las rutas del caché en disco de la limpieza: el DataFrame limpio en Parquet
+    y el log en JSON, junto al CSV original. Las tablas de outliers se guardan aparte en
+    Parquet (ver _ruta_cache_outliers).
+    """
+    return filepath + ".clean.parquet", filepath + ".clean_log.json"
+
+def _ruta_cache_outliers(filepath: str, indice: int) -> str:
+    """
+    Devuelve la ruta del Parquet con la tabla de outliers número `indice` del caché.
+    """
+    return f"{filepath}.clean_outliers_{indice}.parquet"
+
+def _cache_limpieza_vigente(filepath: str) -> bool:
+    """
+    Indica si el caché en disco existe y es más reciente que el CSV y que el código
+    que define la limpieza (este script y data_cleaner.py).
+    """
+    rutas_cache = _rutas_cache_limpieza(filepath)
+    if not all(os.path.exists(r) for r in rutas_cache):
+        return False
+    fuentes = [filepath, __file__, os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_cleaner.py")]
+    ultima_modificacion = max(os.path.getmtime(f) for f in fuentes if os.path.exists(f))
+    return min(os.path.getmtime(r) for r in rutas_cache) > ultima_modificacion
+
+@st.cache_resource
 def ejecutar_limpieza_completa_con_log(filepath: str) -> tuple[pd.DataFrame | None, list, dict]:
     """
     Ejecuta el proceso completo de limpieza de datos utilizando la clase DataCleaner.
     Registra cada paso de la limpieza en un log estructurado y detecta outliers.
+    Se cachea como recurso: el log y los outliers se comparten entre reruns sin copiarse,
+    por lo que deben tratarse como de solo lectura. Además, el resultado se guarda en disco
+    (Parquet + JSON) para que un reinicio del proceso no repita la limpieza desde el CSV.
 
 
     filepath (str): Ruta al archivo CSV que contiene los datos a limpiar.
@@ -70,72 +163,107 @@ def ejecutar_limpieza_completa_con_log(filepath: str) -> tuple[pd.DataFrame | No
             - Lista con el log estructurado de los pasos de limpieza.
             - Diccionario con DataFrames de los outliers detectados antes de su eliminación.
     """
+    ruta_parquet, ruta_log = _rutas_cache_limpieza(filepath)
+    if _cache_limpieza_vigente(filepath):
+        try:
+            # JSON y Parquet solo contienen datos: leerlos no ejecuta código (a diferencia de pickle).
+            with open(ruta_log, encoding="utf-8") as f:
+                cache_log = json.load(f)
+            outliers_cache = {
+                etiqueta: pd.read_parquet(_ruta_cache_outliers(filepath, i))
+                for i, etiqueta in enumerate(cache_log["outliers"])
+            }
+            return pd.read_parquet(ruta_parquet), cache_log["log"], outliers_cache
+        except Exception as e:
+            print(f"No se pudo leer el caché de limpieza en disco, se limpiará nuevamente: {e}")
+
     try:
-        data_handler = DataCleaner(filepath)
+        data_handler = DataCleaner(filepath, dtype=ESQUEMA_CSV_LIMPIEZA)
         limpieza_log_estructurado = [] # Almacena el log para la UI.
         outliers_detectados_ui = {}   # Almacena DataFrames de outliers para la UI.
 
-        # Log: Tipos de datos iniciales.
-        initial_dtypes_df = data_handler.cleaned_data.dtypes.reset_index()
-        initial_dtypes_df.columns = ['Columna', 'Tipo de Dato Original']
-        initial_dtypes_df['Tipo de Dato Original'] = initial_dtypes_df['Tipo de Dato Original'].astype(str)
+        # Log: Tipos de datos iniciales. Se guarda como diccionario de listas (lo acepta
+        # st.dataframe) para no construir un DataFrame solo para el log.
+        tipos_iniciales = data_handler.cleaned_data.dtypes
         limpieza_log_estructurado.append({
             "paso": "Tipos de Datos Iniciales",
-            "detalle_df": initial_dtypes_df
+            "detalle_df": {
+                "Columna": list(tipos_iniciales.index),
+                "Tipo de Dato Original": [str(t) for t in tipos_iniciales],
+            }
         })
 
-        # Log: Detección de outliers en columnas especificadas.
-        cols_para_detectar_outliers = ["costo_real", "cantidad_trabajadores"]
-        for col_detect in cols_para_detectar_outliers:
-            if col_detect in data_handler.cleaned_data.columns and pd.api.types.is_numeric_dtype(data_handler.cleaned_data[col_detect]):
-                df_outliers = data_handler.detect_outliers_iqr(col_detect)
-                summary_text = f"Detección de outliers en `{col_detect}` usando IQR. Función: `detect_outliers_iqr('{col_detect}')`."
-                if not df_outliers.empty:
-                    outliers_detectados_ui[f"Outliers Detectados en '{col_detect}' ({len(df_outliers)} filas)"] = df_outliers
-                    summary_text += f" Se encontraron {len(df_outliers)} outliers (ver tabla abajo)."
-                else:
-                    summary_text += " No se detectaron outliers significativos."
-                limpieza_log_estructurado.append({"paso": "Detección de Outliers", "columna": col_detect, "resumen": summary_text, "funcion": f"detect_outliers_iqr('{col_detect}')"})
-
-        # Log: Eliminación de outliers en columnas especificadas.
+        # Log: Detección y eliminación de outliers (una sola pasada IQR por columna).
+        # Las columnas se procesan en orden y no en paralelo: los límites IQR de cada columna
+        # se calculan sobre las filas que dejó la columna anterior. Las máscaras se combinan
+        # y el DataFrame se recorta una sola vez.
         cols_para_eliminar_outliers = ["costo_real", "cantidad_trabajadores"]
-        for col_outlier in cols_para_eliminar_outliers:
-            if col_outlier in data_handler.cleaned_data.columns and pd.api.types.is_numeric_dtype(data_handler.cleaned_data[col_outlier]):
-                filas_antes = data_handler.cleaned_data.shape[0]
-                data_handler.remove_outliers_iqr(col_outlier)
-                filas_despues = data_handler.cleaned_data.shape[0]
-                filas_eliminadas = filas_antes - filas_despues
-                limpieza_log_estructurado.append({
-                    "paso": "Eliminación de Outliers", "columna": col_outlier,
-                    "metric_label": f"Filas Eliminadas ('{col_outlier}')", "metric_value": filas_eliminadas,
-                    "detalle": f"Dataset pasó de {filas_antes} a {filas_despues} filas.",
-                    "funcion": f"remove_outliers_iqr('{col_outlier}')"
-                })
+        resultados_outliers = data_handler.detect_and_remove_outliers_iqr_columnas(cols_para_eliminar_outliers)
+        for col_outlier, (df_outliers, filas_antes, filas_despues) in resultados_outliers.items():
+            filas_eliminadas = filas_antes - filas_despues
+
+            summary_text = f"Detección de outliers en `{col_outlier}` usando IQR."
+            if not df_outliers.empty:
+                outliers_detectados_ui[f"Outliers Detectados en '{col_outlier}' ({len(df_outliers)} filas)"] = df_outliers
+                summary_text += f" Se encontraron {len(df_outliers)} outliers (ver tabla abajo)."
+            else:
+                summary_text += " No se detectaron outliers significativos."
+            limpieza_log_estructurado.append({
+                "paso": "Detección y Eliminación de Outliers", "columna": col_outlier,
+                "metric_label": f"Filas Eliminadas ('{col_outlier}')", "metric_value": filas_eliminadas,
+                "resumen": summary_text,
+                "detalle": f"Dataset pasó de {filas_antes} a {filas_despues} filas.",
+                "funcion": f"detect_and_remove_outliers_iqr_columnas({cols_para_eliminar_outliers})"
+            })
 
         # Log: Rellenar valores nulos con la mediana en columnas especificadas.
         cols_a_rellenar_mediana = [
             "cantidad_trabajadores", "costo_real", "costo_estimado",
             "avance_estimado", "avance_real"
         ]
+        # Conteo de nulos, medianas e imputación se resuelven en una sola pasada sobre el bloque de columnas.
+        imputaciones = data_handler.rellenar_columnas_con_mediana(cols_a_rellenar_mediana)
         for col_median in cols_a_rellenar_mediana:
-            if col_median in data_handler.cleaned_data.columns:
-                if pd.api.types.is_numeric_dtype(data_handler.cleaned_data[col_median]):
-                    if data_handler.cleaned_data[col_median].isnull().any():
-                        nulos_antes = data_handler.cleaned_data[col_median].isnull().sum()
-                        mediana_usada = data_handler.cleaned_data[col_median].median()
-                        data_handler.rellenar_con_mediana(col_median)
-                        limpieza_log_estructurado.append({
-                            "paso": "Imputación de Nulos con Mediana", "columna": col_median,
-                            "metric_label": f"Nulos Rellenados ('{col_median}')", "metric_value": nulos_antes,
-                            "detalle": f"Se imputaron {nulos_antes} nulos con la mediana: {mediana_usada:,.2f}.",
-                            "funcion": f"rellenar_con_mediana('{col_median}')"
-                        })
-                    else:
-                        limpieza_log_estructurado.append({"paso": "Imputación de Nulos con Mediana", "columna": col_median, "detalle": f"No se encontraron valores nulos para rellenar en `{col_median}`."})
-                else:
-                    limpieza_log_estructurado.append({"paso": "Imputación de Nulos con Mediana", "columna": col_median, "detalle": f"Columna `{col_median}` no es numérica."})
-            else:
+            if col_median in imputaciones:
+                nulos_antes, mediana_usada = imputaciones[col_median]
+                limpieza_log_estructurado.append({
+                    "paso": "Imputación de Nulos con Mediana", "columna": col_median,
+                    "metric_label": f"Nulos Rellenados ('{col_median}')", "metric_value": nulos_antes,
+                    "detalle": f"Se imputaron {nulos_antes} nulos con la mediana: {mediana_usada:,.2f}.",
+                    "funcion": f"rellenar_columnas_con_mediana({cols_a_rellenar_mediana})"
+                })
+            elif col_median not in data_handler.cleaned_data.columns:
                 limpieza_log_estructurado.append({"paso": "Imputación de Nulos con Mediana", "columna": col_median, "detalle": f"Columna `{col_median}` no encontrada."})
+            elif not pd.api.types.is_numeric_dtype(data_handler.cleaned_data[col_median]):
+                limpieza_log_estructurado.append({"paso": "Imputación de Nulos con Mediana", "columna": col_median, "detalle": f"Columna `{col_median}` no es numérica."})
+            else:
+                limpieza_log_estructurado.append({"paso": "Imputación de Nulos con Mediana", "columna": col_median, "detalle": f"No se encontraron valores nulos para rellenar en `{col_median}`."})
+
+        # Convierte las columnas de texto repetitivo a 'category': cada valor único se guarda una
+        # sola vez y groupby/hash trabajan sobre códigos enteros.
+        for col_cat in ("proyecto", "area", "equipo"):
+            if col_cat in data_handler.cleaned_data.columns:
+                data_handler.cleaned_data[col_cat] = data_handler.cleaned_data[col_cat].astype("category")
+
+        # Reduce las columnas numéricas al tipo más pequeño que conserva exactamente sus
+        # valores (costos y avances con decimales siguen en float64).
+        # 'cantidad_trabajadores' es float solo por los nulos ya imputados: se pasa a
+        # entero (pd.to_numeric solo lo hace si todos los valores son enteros).
+        data_handler.compress_dtypes()
+        if "cantidad_trabajadores" in data_handler.cleaned_data.columns:
+            data_handler.cleaned_data["cantidad_trabajadores"] = pd.to_numeric(data_handler.cleaned_data["cantidad_trabajadores"], downcast="integer")
+
+        try:
+            data_handler.cleaned_data.to_parquet(ruta_parquet, compression="zstd")
+            for i, df_outliers in enumerate(outliers_detectados_ui.values()):
+                df_outliers.to_parquet(_ruta_cache_outliers(filepath, i), compression="zstd")
+            # El log se escribe al final: sin él el caché no se considera vigente. Los escalares
+            # de NumPy (ej. conteos de nulos) se guardan como números de Python.
+            with open(ruta_log, "w", encoding="utf-8") as f:
+                json.dump({"log": limpieza_log_estructurado, "outliers": list(outliers_detectados_ui)},
+                          f, ensure_ascii=False, default=lambda valor: valor.item())
+        except Exception as e:
+            print(f"No se pudo guardar el caché de limpieza en disco: {e}")
 
         return data_handler.cleaned_data, limpieza_log_estructurado, outliers_detectados_ui
     except Exception as e:
@@ -143,11 +271,59 @@ def ejecutar_limpieza_completa_con_log(filepath: str) -> tuple[pd.DataFrame | No
         print(f"Error crítico durante la limpieza: {e}")
         return None, [], {}
 
-# Ejecuta la función de limpieza y obtiene los resultados.
-dataframe_final_limpio, log_limpieza_detallado, outliers_info_ui = ejecutar_limpieza_completa_con_log(default_file_path)
+@st.cache_data
+def obtener_dataframe_limpio(filepath: str) -> pd.DataFrame | None:
+    """
+    Devuelve solo el DataFrame limpio, separado del log de limpieza para que los pasos
+    que dependen únicamente de los datos no arrastren los DataFrames del log.
+
+    filepath (str): Ruta al archivo CSV que contiene los datos a limpiar.
+
+    pd.DataFrame | None: DataFrame limpio (o None si ocurre un error).
+    """
+    return ejecutar_limpieza_completa_con_log(filepath)[0]
+
+@st.cache_data
+def obtener_vista_previa_limpia(filepath: str) -> pa.Table | None:
+    """
+    Devuelve las primeras filas del DataFrame limpio como tabla Arrow, lista para `st.dataframe`
+    sin volver a serializar el DataFrame en cada rerun.
+
+    filepath (str): Ruta al archivo CSV que contiene los datos a limpiar.
+
+    pa.Table | None: Vista previa en formato Arrow (o None si la limpieza falló).
+    """
+    df_limpio = ejecutar_limpieza_completa_con_log(filepath)[0]
+    if df_limpio is None:
+        return None
+    return pa.Table.from_pandas(df_limpio.head())
+
+@st.cache_data
+def calcular_huella_dataframe(filepath: str) -> int:
+    """
+    Calcula una sola vez una huella (hash de contenido) del DataFrame limpio, para usarla
+    como clave de caché en lugar de que Streamlit vuelva a hashear el DataFrame completo
+    en cada rerun.
+
+    filepath (str): Ruta al archivo CSV que contiene los datos a limpiar.
+
+    int: Huella del DataFrame limpio (0 si la limpieza falló).
+    """
+    df_limpio = obtener_dataframe_limpio(filepath)
+    if df_limpio is None:
+        return 0
+    return int(pd.util.hash_pandas_object(df_limpio, index=False).sum())
 
-# Muestra el log detallado del proceso de limpieza en un expander.
-with st.expander("Ver Detalles del Proceso de Limpieza Aplicado", expanded=False):
+# Ejecuta la función de limpieza y obtiene los resultados.
+dataframe_final_limpio = obtener_dataframe_limpio(default_file_path)
+# Huella del DataFrame limpio: clave de caché de los pasos siguientes, que reciben el
+# DataFrame como argumento `_df` (no hasheado por Streamlit).
+huella_df_limpio = calcular_huella_dataframe(default_file_path)
+_, log_limpieza_detallado, outliers_info_ui = ejecutar_limpieza_completa_con_log(default_file_path)
+
+# Muestra el log detallado del proceso de limpieza solo si el usuario lo pide: a diferencia
+# de un expander cerrado, con el interruptor apagado los elementos no se envían al navegador.
+if st.toggle("Ver Detalles del Proceso de Limpieza Aplicado", key="mostrar_log_limpieza"):
     if log_limpieza_detallado:
         for item in log_limpieza_detallado:
             st.markdown(f"**{item['paso']}**" + (f" (Columna: `{item.get('columna','N/A')}`)" if "columna" in item else ""))
@@ -166,12 +342,12 @@ with st.expander("Ver Detalles del Proceso de Limpieza Aplicado", expanded=False
         st.markdown("**DataFrames de Outliers Detectados (antes de su eliminación):**")
         for titulo_outlier, df_o in outliers_info_ui.items():
             st.caption(titulo_outlier)
-            st.dataframe(df_o, height=150)
+            st.table(df_o) # Pocas filas y sin interacción: tabla estática.
 
 # Muestra una vista previa del DataFrame resultante después de la limpieza.
 st.subheader("Datos Limpios (Resultado)")
 if dataframe_final_limpio is not None and not dataframe_final_limpio.empty:
-    st.dataframe(dataframe_final_limpio.head(), height=180)
+    st.dataframe(obtener_vista_previa_limpia(default_file_path), height=180)
     st.success(f"Limpieza completada. Filas: {len(dataframe_final_limpio)} (Originales: {len(df_original)})")
 else:
     st.error("El DataFrame está vacío o no se pudo limpiar. Revisa la consola para detalles.")
@@ -181,56 +357,140 @@ st.markdown("---")
 # --- PASO 2: Análisis POO ---
 # Sección para realizar un análisis utilizando un enfoque de Programación Orientada a Objetos (POO).
 st.header("2. Resumen del Análisis Orientado a Objetos")
-registros_obj_list = [] # Lista para almacenar objetos de tipo Registro.
-proyectos_dict = {}     # Diccionario para almacenar objetos de tipo Proyecto, indexados por nombre.
-equipos_global_dict = {} # Diccionario para almacenar objetos de tipo Equipo (global), indexados por nombre.
+
+@st.cache_data
+def calcular_agregados_proyectos(_df: pd.DataFrame, huella_df: int) -> pd.DataFrame:
+    """
+    Calcula con un solo groupby los totales de costo, la desviación y el rendimiento
+    de cada proyecto (mismas fórmulas que los métodos de `Proyecto`), para que el
+    render solo tenga que leerlos.
+
+    _df (pd.DataFrame): DataFrame limpio (no se hashea).
+    huella_df (int): Huella del DataFrame, usada como clave de caché.
+
+    pd.DataFrame: Indexado por proyecto, con columnas 'costo_estimado', 'costo_real',
+                  'desviacion' y 'rendimiento'.
+    """
+    cols = ["costo_estimado", "costo_real", "avance_estimado", "avance_real"]
+    sumas = _df[cols].astype(float).groupby(_df["proyecto"], observed=True).sum()
+    sumas["desviacion"] = sumas["costo_real"] - sumas["costo_estimado"]
+    sumas["rendimiento"] = np.where(sumas["avance_estimado"] == 0, 100.0,
+                                    sumas["avance_real"] / sumas["avance_estimado"].where(sumas["avance_estimado"] != 0) * 100)
+    return sumas[["costo_estimado", "costo_real", "desviacion", "rendimiento"]]
+
+@st.cache_data
+def calcular_agregados_areas_equipos(_df: pd.DataFrame, huella_df: int) -> tuple[dict, dict]:
+    """
+    Calcula con groupby las métricas de cada área y de cada equipo dentro de cada proyecto,
+    con las mismas fórmulas que `Area.eficiencia_promedio`/`total_sobrecosto` y
+    `Equipo.eficiencia_promedio`/`trabajadores_totales`.
+
+    _df (pd.DataFrame): DataFrame limpio (no se hashea).
+    huella_df (int): Huella del DataFrame, usada como clave de caché.
+
+    tuple[dict, dict]:
+            - {proyecto: DataFrame indexado por área con 'eficiencia' y 'sobrecosto'}.
+            - {proyecto: DataFrame indexado por equipo con 'eficiencia' y 'trabajadores'}.
+    """
+    # Registro trata los valores faltantes como 0 y trunca los trabajadores a entero.
+    valores = _df[["costo_estimado", "costo_real", "avance_estimado", "avance_real"]].astype(float).fillna(0.0)
+    valores["sobrecosto"] = valores["costo_real"] - valores["costo_estimado"]
+    valores["eficiencia"] = np.where(valores["avance_estimado"] == 0, 100.0,
+                                     valores["avance_real"] / valores["avance_estimado"].where(valores["avance_estimado"] != 0) * 100)
+    valores["trabajadores"] = np.trunc(_df["cantidad_trabajadores"].astype(float).fillna(0.0)).astype(int)
+
+    por_area = valores.groupby([_df["proyecto"], _df["area"]], observed=True).agg(
+        avance_estimado=("avance_estimado", "sum"), avance_real=("avance_real", "sum"),
+        sobrecosto=("sobrecosto", "sum"))
+    por_area["eficiencia"] = np.where(por_area["avance_estimado"] == 0, 100.0,
+                                      por_area["avance_real"] / por_area["avance_estimado"].where(por_area["avance_estimado"] != 0) * 100)
+    por_equipo = valores.groupby([_df["proyecto"], _df["equipo"]], observed=True).agg(
+        eficiencia=("eficiencia", "mean"), trabajadores=("trabajadores", "sum"))
+
+    areas = {proy: sub.droplevel(0)[["eficiencia", "sobrecosto"]].sort_index()
+             for proy, sub in por_area.groupby(level=0, observed=True)}
+    equipos = {proy: sub.droplevel(0).sort_index()
+               for proy, sub in por_equipo.groupby(level=0, observed=True)}
+    return areas, equipos
+
+@st.cache_data
+def formatear_tablas_areas_equipos(_df: pd.DataFrame, huella_df: int) -> tuple[dict, dict]:
+    """
+    Da formato de texto a las métricas de `calcular_agregados_areas_equipos` para
+    mostrarlas con un `st.table` por proyecto, en vez de un bloque de texto por área/equipo.
+
+    _df (pd.DataFrame): DataFrame limpio (no se hashea).
+    huella_df (int): Huella del DataFrame, usada como clave de caché.
+
+    tuple[dict, dict]:
+            - {proyecto: tabla de áreas con 'Eficiencia Promedio' y 'Sobrecosto Total en Área'}.
+            - {proyecto: tabla de equipos con 'Eficiencia Promedio' y 'Trabajadores Totales'}.
+    """
+    agregados_areas, agregados_equipos = calcular_agregados_areas_equipos(_df, huella_df)
+    tablas_areas = {
+        proy: pd.DataFrame({
+            "Eficiencia Promedio": areas["eficiencia"].map("{:.2f}%".format),
+            "Sobrecosto Total en Área": areas["sobrecosto"].map("${:,.0f}".format),
+        }).rename_axis("Área")
+        for proy, areas in agregados_areas.items()
+    }
+    tablas_equipos = {
+        proy: pd.DataFrame({
+            "Eficiencia Promedio": equipos["eficiencia"].map("{:.2f}%".format),
+            "Trabajadores Totales": equipos["trabajadores"].astype(str),
+        }).rename_axis("Equipo")
+        for proy, equipos in agregados_equipos.items()
+    }
+    return tablas_areas, tablas_equipos
+
+@st.cache_data
+def columnas_disponibles(filepath: str, columnas: tuple) -> bool:
+    """
+    Indica si el DataFrame limpio contiene todas las columnas indicadas. Como las columnas
+    quedan fijas al cachear la limpieza, la comprobación solo se hace en un fallo de caché.
+
+    filepath (str): Ruta al archivo CSV que contiene los datos a limpiar.
+    columnas (tuple): Columnas requeridas.
+
+    bool: True si están todas las columnas.
+    """
+    df_limpio = obtener_dataframe_limpio(filepath)
+    return df_limpio is not None and set(columnas).issubset(df_limpio.columns)
 
 # Verifica que las columnas necesarias para el análisis POO existan en el DataFrame limpio.
 required_cols_registro = ["id", "proyecto", "area", "equipo", "costo_estimado", "costo_real", "avance_estimado", "avance_real", "cantidad_trabajadores"]
-if not all(col in dataframe_final_limpio.columns for col in required_cols_registro):
+if not columnas_disponibles(default_file_path, tuple(required_cols_registro)):
     st.error(f"Faltan columnas críticas para el análisis POO: {', '.join(required_cols_registro)}. No se puede continuar con esta sección.")
 else:
-    # Itera sobre las filas del DataFrame limpio para crear objetos Registro.
-    for _, row in dataframe_final_limpio.iterrows():
-        try:
-            reg_obj = Registro(
-                id=row["id"], proyecto=row["proyecto"], area=row["area"], equipo=row["equipo"],
-                costo_estimado=row["costo_estimado"], costo_real=row["costo_real"],
-                avance_estimado=row["avance_estimado"], avance_real=row["avance_real"],
-                trabajadores=row["cantidad_trabajadores"]
-            )
-            registros_obj_list.append(reg_obj)
-        except Exception as e:
-            
-            pass # Continúa con la siguiente fila en caso de error.
-
-    # Agrega los registros a sus respectivos proyectos y equipos.
-    for r_obj in registros_obj_list:
-        if r_obj.proyecto: # Asegura que el nombre del proyecto no sea nulo o vacío.
-            if r_obj.proyecto not in proyectos_dict:
-                proyectos_dict[r_obj.proyecto] = Proyecto(r_obj.proyecto)
-            proyectos_dict[r_obj.proyecto].agregar_registro(r_obj)
-
-        # Agrega registros a un diccionario global de equipos
-        if r_obj.equipo:
-            if r_obj.equipo not in equipos_global_dict:
-                equipos_global_dict[r_obj.equipo] = Equipo(r_obj.equipo)
-            equipos_global_dict[r_obj.equipo].agregar_registro(r_obj)
-
-    # Muestra indicadores generales calculados a partir de los objetos.
+    # Todas las métricas de esta sección salen de agregados vectorizados y cacheados (con las
+    # mismas fórmulas que las clases de models.py), por lo que no hace falta construir un
+    # objeto Registro por fila ni el grafo de Proyectos/Equipos para mostrarlas.
+    # Totales por proyecto (un groupby cacheado) para el ranking y el detalle.
+    agregados_proyectos = calcular_agregados_proyectos(dataframe_final_limpio, huella_df_limpio)
+
+    # Muestra indicadores generales calculados sobre las columnas del DataFrame limpio.
     st.subheader("📊 Indicadores Generales del Conjunto de Datos")
-    if registros_obj_list:
-        eficiencia_gral = Indicadores.eficiencia_general(registros_obj_list)
+    if not dataframe_final_limpio.empty:
+        eficiencia_gral = Indicadores.eficiencia_general_vec(
+            dataframe_final_limpio["avance_real"].to_numpy(),
+            dataframe_final_limpio["avance_estimado"].to_numpy()
+        )
         st.metric(label="Eficiencia General (Todos los Registros)", value=f"{eficiencia_gral:.2f}%")
     else:
         st.info("No hay registros para calcular la eficiencia general.")
 
     # Muestra un ranking de proyectos por sobrecosto.
-    if proyectos_dict:
+    if not agregados_proyectos.empty:
         st.markdown("**🏆 Ranking de Proyectos por Sobrecosto (Mayor a Menor):**")
-        ranking_proy = Indicadores.ranking_proyectos_por_sobrecosto(list(proyectos_dict.values()))
-        for i, p_obj in enumerate(ranking_proy):
-            st.markdown(f"&nbsp;&nbsp;{i+1}. {p_obj.nombre}: ${p_obj.desviacion_presupuesto():,.0f}")
+        # Mismo orden que Indicadores.ranking_proyectos_por_sobrecosto, pero leído de los
+        # agregados por proyecto en vez de recorrer los registros de cada objeto.
+        ranking_proy = agregados_proyectos["desviacion"].sort_values(ascending=False, kind="stable")
+        # Todo el ranking en un solo bloque markdown (un elemento en vez de uno por proyecto);
+        # "  \n" es un salto de línea de Markdown.
+        st.markdown("  \n".join(
+            f"&nbsp;&nbsp;{i+1}. {nombre_proy}: ${desviacion:,.0f}"
+            for i, (nombre_proy, desviacion) in enumerate(ranking_proy.items())
+        ))
     else:
         st.info("No hay proyectos para generar el ranking.")
     st.markdown("---")
@@ -238,37 +498,39 @@ else:
 
     # Muestra un análisis detallado por proyecto, incluyendo áreas y equipos anidados.
     st.subheader("📄 Análisis Detallado por Proyecto, Área y Equipo")
-    if proyectos_dict:
-        for nombre_proyecto, proyecto_obj in sorted(proyectos_dict.items()):
-            if not proyecto_obj.registros: continue # Omite proyectos sin registros.
+    if not agregados_proyectos.empty:
+        tablas_areas, tablas_equipos = formatear_tablas_areas_equipos(dataframe_final_limpio, huella_df_limpio)
+        # Una tupla (estimado, real, desviación, rendimiento) por proyecto, armada de una vez
+        # para no crear una Series con .loc en cada expander.
+        resumen_por_proyecto = {nombre: valores for nombre, *valores in agregados_proyectos.itertuples(name=None)}
+        # groupby(observed=True) solo deja proyectos con registros; se recorren por nombre.
+        for nombre_proyecto, (costo_estimado_proy, costo_real_proy, desviacion_proy, rendimiento_proy) in sorted(resumen_por_proyecto.items()):
             with st.expander(f"🏗️ Proyecto: {nombre_proyecto}", expanded=True):
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.markdown(f"**Costos y Desviación:**")
-                    st.markdown(f"&nbsp;&nbsp;- Estimado Total: `${proyecto_obj.costo_total_estimado():,.0f}`")
-                    st.markdown(f"&nbsp;&nbsp;- Real Total: `${proyecto_obj.costo_total_real():,.0f}`")
-                    st.markdown(f"&nbsp;&nbsp;- Desviación Presup.: `${proyecto_obj.desviacion_presupuesto():,.0f}`")
+                    st.markdown(
+                        f"**Costos y Desviación:**  \n"
+                        f"&nbsp;&nbsp;- Estimado Total: `${costo_estimado_proy:,.0f}`  \n"
+                        f"&nbsp;&nbsp;- Real Total: `${costo_real_proy:,.0f}`  \n"
+                        f"&nbsp;&nbsp;- Desviación Presup.: `${desviacion_proy:,.0f}`"
+                    )
                 with col2:
                     st.markdown(f"**Rendimiento:**")
-                    st.metric(label="Rendimiento Promedio del Proyecto", value=f"{proyecto_obj.rendimiento_promedio():.2f}%")
+                    st.metric(label="Rendimiento Promedio del Proyecto", value=f"{rendimiento_proy:.2f}%")
 
-                # Análisis por Área dentro del Proyecto.
-                if proyecto_obj.areas:
+                # Análisis por Área dentro del Proyecto (una tabla por proyecto).
+                tabla_areas = tablas_areas.get(nombre_proyecto)
+                if tabla_areas is not None and not tabla_areas.empty:
                     st.markdown("**Áreas dentro del Proyecto:**")
-                    for nombre_area_proy, area_obj_proy in sorted(proyecto_obj.areas.items()):
-                        st.markdown(f"&nbsp;&nbsp;📍 **{nombre_area_proy}**")
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;- Eficiencia Promedio: `{area_obj_proy.eficiencia_promedio():.2f}%`")
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;- Sobrecosto Total en Área: `${area_obj_proy.total_sobrecosto():,.0f}`")
+                    st.table(tabla_areas)
                 else:
                     st.markdown("_No hay detalle por áreas para este proyecto._")
 
-                # Análisis por Equipo dentro del Proyecto.
-                if proyecto_obj.equipos:
+                # Análisis por Equipo dentro del Proyecto (una tabla por proyecto).
+                tabla_equipos = tablas_equipos.get(nombre_proyecto)
+                if tabla_equipos is not None and not tabla_equipos.empty:
                     st.markdown("**Equipos dentro del Proyecto:**")
-                    for nombre_equipo_proy, equipo_obj_proy in sorted(proyecto_obj.equipos.items()):
-                        st.markdown(f"&nbsp;&nbsp;👥 **{nombre_equipo_proy}**")
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;- Eficiencia Promedio: `{equipo_obj_proy.eficiencia_promedio():.2f}%`")
-                        st.markdown(f"&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;&nbsp;- Trabajadores Totales: `{equipo_obj_proy.trabajadores_totales()}`")
+                    st.table(tabla_equipos)
                 else:
                     st.markdown("_No hay detalle por equipos para este proyecto._")
     else:
@@ -279,89 +541,210 @@ else:
 # Sección para generar y mostrar visualizaciones de datos de forma automática.
 st.header("3. Panel de Visualizaciones Recomendadas")
 
-analisis_a_realizar = [] # Lista para definir los análisis (gráficos) a generar.
+@st.cache_data
+def calcular_matriz_correlacion(_df: pd.DataFrame, huella_df: int) -> pd.DataFrame:
+    """
+    Calcula una sola vez la matriz de correlación de Pearson de las columnas numéricas.
 
-# Agrega un análisis de heatmap de correlación si hay suficientes datos numéricos.
-if dataframe_final_limpio is not None and not dataframe_final_limpio.empty:
-    df_numeric_check = dataframe_final_limpio.select_dtypes(include=np.number)
-    if not df_numeric_check.empty and len(df_numeric_check.columns) > 1:
-        analisis_a_realizar.append({
-            "tipo_especial": "heatmap_correlacion",
-            "titulo_seccion": "Heatmap de Correlación General"
-        })
+    _df (pd.DataFrame): DataFrame limpio (no se hashea).
+    huella_df (int): Huella del DataFrame, usada como clave de caché.
+
+    pd.DataFrame: Matriz de correlación (vacía si hay menos de dos columnas numéricas).
+    """
+    df_numeric = _df.select_dtypes(include=np.number)
+    if df_numeric.shape[1] < 2:
+        return pd.DataFrame()
+    # Ya son todas numéricas: sin numeric_only, corr no vuelve a filtrar las columnas.
+    return df_numeric.corr(method="pearson")
+
+def _importar_pyplot():
+    """
+    Importa pyplot con el backend Agg (solo rasteriza a PNG, sin ventanas) y la
+    simplificación de trazados activada, para que las figuras se dibujen más rápido.
+
+    module: El módulo `matplotlib.pyplot` ya configurado.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.rcParams.update({
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+    })
+    return plt
+
+@st.cache_data
+def renderizar_heatmap_png(corr_matrix: pd.DataFrame, titulo: str) -> bytes:
+    """
+    Dibuja el heatmap de correlación y lo devuelve como imagen PNG.
+    Al estar cacheado, los reruns de Streamlit reutilizan la imagen en vez de rehacer la figura.
+
+    corr_matrix (pd.DataFrame): Matriz de correlación a graficar.
+    titulo (str): Título del gráfico.
+
+    bytes: Contenido PNG de la figura.
+    """
+    # Importaciones diferidas: matplotlib/seaborn solo se cargan cuando se dibuja el Paso 3.
+    plt = _importar_pyplot()
+    import seaborn as sns
+
+    fig_heatmap, ax_heatmap = plt.subplots(figsize=(6, 4))
+    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt=".2f",
+                linewidths=.3, ax=ax_heatmap, cbar=True, annot_kws={"size": 7})
+    ax_heatmap.set_title(titulo, fontsize=10)
+    ax_heatmap.tick_params(axis='x', labelsize=8, rotation=45)
+    ax_heatmap.tick_params(axis='y', labelsize=8, rotation=0)
+    fig_heatmap.tight_layout(pad=0.5)
+    buffer = io.BytesIO()
+    fig_heatmap.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
+    plt.close(fig_heatmap)
+    return buffer.getvalue()
+
+@st.cache_resource
+def _figura_compartida_graficos() -> tuple:
+    """
+    Crea una única figura de Matplotlib que se reutiliza para todos los grupos de gráficos
+    dinámicos (crear una figura nueva es la parte más costosa en gráficos pequeños).
+    La figura no se registra en pyplot, así que no se acumula entre reruns. Como el recurso
+    se comparte entre sesiones, se acompaña de un candado para dibujar de a un grupo a la vez.
+
+    tuple: (figura, candado) con la `matplotlib.figure.Figure` compartida y su `threading.Lock`.
+    """
+    _importar_pyplot() # Fija el backend Agg antes de crear la figura.
+    from matplotlib.figure import Figure
+    return Figure(), threading.Lock()
+
+@st.cache_data
+def renderizar_grafico_dinamico_png(_df: pd.DataFrame, huella_df: int, col1_name: str, col2_name: str | None,
+                                    base_figsize_w: float, base_figsize_h: float) -> bytes | None:
+    """
+    Genera el grupo de gráficos recomendados para una columna (o par de columnas) y lo
+    devuelve como imagen PNG. El caché queda indexado por la huella del DataFrame y las
+    columnas (el DataFrame en sí no se hashea), así cada panel se dibuja una sola vez y
+    solo cuando se muestra. Todos los paneles se dibujan sobre la misma figura, que se
+    limpia y redimensiona en cada llamada (ver `_figura_compartida_graficos`).
+
+    _df (pd.DataFrame): DataFrame limpio.
+    huella_df (int): Huella del DataFrame, ver `calcular_huella_dataframe`.
+    col1_name (str): Columna principal.
+    col2_name (str | None): Segunda columna; None en el caso univariado.
+    base_figsize_w (float), base_figsize_h (float): Tamaño base de cada subgráfico.
+
+    bytes | None: Contenido PNG del grupo (None si no se generaron gráficos).
+    """
+    from visualizador_dinamico import generar_graficos_dinamicos
+
+    figura_compartida, candado_figura = _figura_compartida_graficos()
+    with candado_figura:
+        figura_grupo, _, _ = generar_graficos_dinamicos(
+            df=_df,
+            col1_name=col1_name,
+            col2_name=col2_name,
+            export_dir=None,
+            show_plot=False, # La visualización se maneja con st.image.
+            base_figsize_w=base_figsize_w,
+            base_figsize_h=base_figsize_h,
+            fig=figura_compartida
+        )
+        if figura_grupo is None:
+            return None
+        buffer = io.BytesIO()
+        figura_grupo.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
+    return buffer.getvalue()
 
 # Define columnas para análisis univariados.
-columnas_univariadas_interes = ['costo_real', 'costo_estimado', 'avance_real', 'avance_estimado', 'cantidad_trabajadores']
-for col_name in columnas_univariadas_interes:
-    if col_name in dataframe_final_limpio.columns:
-        analisis_a_realizar.append({"col1": col_name, "col2": None, "titulo_seccion": f"Análisis de '{col_name}'"})
+columnas_univariadas_interes = ('costo_real', 'costo_estimado', 'avance_real', 'avance_estimado', 'cantidad_trabajadores')
 
 # Define pares de columnas para análisis bivariados.
-pares_bivariados_interes = [
+pares_bivariados_interes = (
     ('costo_estimado', 'costo_real'), ('avance_estimado', 'avance_real'),
     ('cantidad_trabajadores', 'costo_real'), ('cantidad_trabajadores', 'avance_real')
-]
-for col1, col2 in pares_bivariados_interes:
-    if col1 in dataframe_final_limpio.columns and col2 in dataframe_final_limpio.columns:
-        analisis_a_realizar.append({"col1": col1, "col2": col2, "titulo_seccion": f"Relación '{col1}' vs '{col2}'"})
+)
+
+@st.cache_data
+def construir_analisis(columnas: tuple, incluir_heatmap: bool) -> list:
+    """
+    Construye la lista de análisis (gráficos) a generar según las columnas disponibles.
+    Se cachea por la tupla de columnas, por lo que no se reconstruye en cada rerun.
+
+    columnas (tuple): Nombres de las columnas del DataFrame limpio.
+    incluir_heatmap (bool): Si se agrega el heatmap de correlación al inicio.
+
+    list: Lista de diccionarios con la configuración de cada análisis.
+    """
+    cols_set = frozenset(columnas) # Búsqueda O(1) en vez de recorrer el Index de columnas.
+    analisis = []
+    if incluir_heatmap:
+        analisis.append({
+            "tipo_especial": "heatmap_correlacion",
+            "titulo_seccion": "Heatmap de Correlación General"
+        })
+    for col_name in columnas_univariadas_interes:
+        if col_name in cols_set:
+            analisis.append({"col1": col_name, "col2": None, "titulo_seccion": f"Análisis de '{col_name}'"})
+    for col1, col2 in pares_bivariados_interes:
+        if col1 in cols_set and col2 in cols_set:
+            analisis.append({"col1": col1, "col2": col2, "titulo_seccion": f"Relación '{col1}' vs '{col2}'"})
+    return analisis
+
+# Agrega un análisis de heatmap de correlación si hay suficientes datos numéricos.
+corr_matrix = pd.DataFrame()
+if dataframe_final_limpio is not None and not dataframe_final_limpio.empty:
+    corr_matrix = calcular_matriz_correlacion(dataframe_final_limpio, huella_df_limpio)
+
+# Lista para definir los análisis (gráficos) a generar.
+analisis_a_realizar = construir_analisis(tuple(dataframe_final_limpio.columns), not corr_matrix.empty)
 
 # Define dimensiones base para los gráficos dinámicos.
 base_fig_w_dinamico = 3.0
 base_fig_h_dinamico = 2.5
 
-# Crea columnas en Streamlit para organizar las visualizaciones.
-st_cols_viz = st.columns(2)
-col_idx_viz_streamlit = 0 # Índice para ciclar entre las columnas de Streamlit.
-
-# Itera sobre la lista de análisis definidos para generar y mostrar cada visualización.
-for analisis_info in analisis_a_realizar:
-    with st_cols_viz[col_idx_viz_streamlit % len(st_cols_viz)]: # Cicla entre las columnas disponibles.
-        st.subheader(f"{analisis_info['titulo_seccion']}")
-
-        # Genera un heatmap de correlación
-        if analisis_info.get("tipo_especial") == "heatmap_correlacion":
-            with st.spinner("Generando Heatmap de Correlación..."):
-                df_numeric = dataframe_final_limpio.select_dtypes(include=np.number)
-                if df_numeric.shape[1] >= 2:
-                    corr_matrix = df_numeric.corr()
-                    fig_heatmap_width = 6  
-                    fig_heatmap_height = 4 
-
-                    fig_heatmap, ax_heatmap = plt.subplots(figsize=(fig_heatmap_width, fig_heatmap_height))
-                    sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', fmt=".2f",
-                                linewidths=.3, ax=ax_heatmap, cbar=True, annot_kws={"size": 7})
-                    ax_heatmap.set_title(analisis_info['titulo_seccion'], fontsize=10)
-                    ax_heatmap.tick_params(axis='x', labelsize=8, rotation=45)
-                    ax_heatmap.tick_params(axis='y', labelsize=8, rotation=0)
-                    plt.tight_layout(pad=0.5)
-                    st.pyplot(fig_heatmap)
-                    plt.close(fig_heatmap) 
-                else:
-                    st.info("No hay suficientes datos numéricos para el heatmap de correlación.")
-        else:
-            # Genera gráficos dinámicos 
-            resultado_graficos = generar_graficos_dinamicos(
-                df=dataframe_final_limpio,
-                col1_name=analisis_info.get("col1"),
-                col2_name=analisis_info.get("col2"),
-                export_dir=None, 
-                show_plot=False, # La visualización se maneja con st.pyplot.
-                base_figsize_w=base_fig_w_dinamico,
-                base_figsize_h=base_fig_h_dinamico
-            )
-
-            figura_grupo = None
-            if resultado_graficos and isinstance(resultado_graficos, tuple) and len(resultado_graficos) > 0:
-                figura_grupo = resultado_graficos[0] 
-
-            if figura_grupo:
-                st.pyplot(figura_grupo)
-                plt.close(figura_grupo) 
-            elif not analisis_info.get("col1"):
-                st.caption("No se pudo generar gráfico para esta selección.")
-
-    col_idx_viz_streamlit += 1 
+# Solo los primeros paneles se dibujan al cargar la página; el resto se genera bajo
+# demanda cuando el usuario activa su interruptor.
+paneles_visibles_al_inicio = 2
+
+@st.fragment
+def mostrar_panel_visualizaciones(analisis_a_realizar: list) -> None:
+    """
+    Dibuja la grilla de visualizaciones. Al ser un fragmento, activar el interruptor de un
+    panel solo vuelve a ejecutar esta función y no toda la página.
+
+    analisis_a_realizar (list): Análisis a mostrar, ver `construir_analisis`.
+    """
+    # Crea columnas en Streamlit para organizar las visualizaciones.
+    st_cols_viz = st.columns(2)
+    col_idx_viz_streamlit = 0 # Índice para ciclar entre las columnas de Streamlit.
+
+    # Itera sobre la lista de análisis definidos para generar y mostrar cada visualización.
+    for analisis_info in analisis_a_realizar:
+        with st_cols_viz[col_idx_viz_streamlit % len(st_cols_viz)]: # Cicla entre las columnas disponibles.
+            st.subheader(f"{analisis_info['titulo_seccion']}")
+
+            # Genera un heatmap de correlación
+            if analisis_info.get("tipo_especial") == "heatmap_correlacion":
+                with st.spinner("Generando Heatmap de Correlación..."):
+                    if not corr_matrix.empty:
+                        st.image(renderizar_heatmap_png(corr_matrix, analisis_info['titulo_seccion']), use_container_width=True)
+                    else:
+                        st.info("No hay suficientes datos numéricos para el heatmap de correlación.")
+            elif col_idx_viz_streamlit < paneles_visibles_al_inicio or st.toggle("Mostrar gráficos", key=f"mostrar_viz_{col_idx_viz_streamlit}"):
+                # Genera (o recupera del caché) el grupo de gráficos dinámicos.
+                png_grupo = renderizar_grafico_dinamico_png(
+                    dataframe_final_limpio, huella_df_limpio,
+                    analisis_info.get("col1"), analisis_info.get("col2"),
+                    base_fig_w_dinamico, base_fig_h_dinamico
+                )
+
+                if png_grupo:
+                    st.image(png_grupo, use_container_width=True)
+                elif not analisis_info.get("col1"):
+                    st.caption("No se pudo generar gráfico para esta selección.")
+
+        col_idx_viz_streamlit += 1 
+
+mostrar_panel_visualizaciones(analisis_a_realizar)
 st.markdown("---")
 
 
-st.caption(f"Fin del reporte. Análisis Nualart - {datetime.now().strftime('%d/%m/%Y %H:%M')}")
\ No newline at end of file
+st.caption(f"Fin del reporte. Análisis Nualart - {st.session_state.fecha_generacion.strftime('%d/%m/%Y %H:%M')}")
\ No newline at end of file
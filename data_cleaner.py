@@ -1,8 +1,62 @@
+from __future__ import annotations
+
 import numpy as np
 import os
 import unicodedata
 import pandas as pd
 
+def _limites_iqr(valores: np.ndarray) -> tuple[float, float, float]:
+    """
+    Calcula los límites IQR (Q1 - 1.5*IQR, Q3 + 1.5*IQR) directamente sobre un arreglo NumPy,
+    obteniendo Q1 y Q3 en una sola llamada e ignorando los NaN (igual que `Series.quantile`).
+
+    valores (np.ndarray): Los valores de la columna.
+
+    tuple[float, float, float]: (limite_inferior, limite_superior, IQR).
+    """
+    Q1, Q3 = np.nanquantile(valores, [0.25, 0.75])
+    IQR = Q3 - Q1
+    return Q1 - 1.5 * IQR, Q3 + 1.5 * IQR, IQR
+
+def _leer_datos(filepath_or_buffer, dtype: dict | None = None, columnas: list[str] | None = None) -> pd.DataFrame:
+    """
+    Lee los datos de entrada eligiendo el formato según la extensión. Un archivo `.parquet`
+    se lee directamente (columnar, sin parseo de texto). Cualquier otra ruta, o un buffer,
+    se parsea como CSV con `pd.read_csv` y el motor multihilo de pyarrow, que aplica los
+    mismos valores nulos (celdas vacías, "NA", "None", ...) que el parser por defecto.
+    Si se indican `columnas`, solo esas se leen del archivo (en Parquet ni siquiera se
+    descomprimen las demás).
+
+    filepath_or_buffer (str | buffer): Ruta al archivo o buffer con contenido CSV.
+    dtype (dict | None): Tipos de columna opcionales {columna: tipo}.
+    columnas (list[str] | None): Columnas a cargar, en el orden indicado. None carga todas.
+
+    pd.DataFrame: Los datos cargados.
+    """
+    if isinstance(filepath_or_buffer, str) and os.path.splitext(filepath_or_buffer)[1].lower() == ".parquet":
+        datos = pd.read_parquet(filepath_or_buffer, columns=columnas)
+        if dtype:
+            # Igual que en el CSV, se ignoran los tipos de columnas que no se cargaron.
+            dtype = {c: t for c, t in dtype.items() if c in datos.columns}
+        return datos.astype(dtype) if dtype else datos
+    return pd.read_csv(filepath_or_buffer, engine="pyarrow", dtype=dtype, usecols=columnas)
+
+def _contar_nulos(serie: pd.Series) -> int:
+    """
+    Cuenta los nulos de una columna recorriendo lo mínimo posible: las columnas NumPy
+    enteras o booleanas no pueden tener nulos (no se recorren) y en las columnas respaldadas
+    por Arrow el conteo ya está guardado en los metadatos del arreglo (O(1)).
+
+    serie (pd.Series): La columna a revisar.
+
+    int: La cantidad de valores nulos.
+    """
+    if isinstance(serie.dtype, np.dtype) and serie.dtype.kind in "iub":
+        return 0
+    if isinstance(serie.dtype, pd.ArrowDtype):
+        return serie.array.__arrow_array__().null_count
+    return int(serie.isna().sum())
+
 class DataCleaner:
     """
     Clase para realizar diversas operaciones de limpieza y preprocesamiento de datos
@@ -13,9 +67,17 @@ class DataCleaner:
         cleaned_data (pd.DataFrame): Una copia del DataFrame original que se modifica
                                      a medida que se aplican los métodos de limpieza.
     """
-    def __init__(self, filepath_or_buffer):
+    def __init__(self, filepath_or_buffer, dtype: dict | None = None, columnas: list[str] | None = None):
         """
-        Inicializa el objeto DataCleaner cargando datos desde un archivo CSV o un buffer.
+        Inicializa el objeto DataCleaner cargando datos desde un archivo CSV o Parquet, o un buffer.
+        El CSV se parsea con el motor de pyarrow (multihilo); los tipos resultantes son
+        los mismos que con el parser por defecto. Ver `_leer_datos` para la elección del formato.
+
+        filepath_or_buffer (str | buffer): Ruta al archivo CSV/Parquet o buffer con contenido CSV.
+        dtype (dict | None): Tipos de columna opcionales {columna: tipo}; las columnas
+                             indicadas no pasan por la inferencia de tipos.
+        columnas (list[str] | None): Columnas a cargar. Útil cuando solo se van a procesar
+                                     algunas columnas de un archivo ancho. None carga todas.
 
         FileNotFoundError: Si `filepath_or_buffer` es una cadena de ruta y el archivo no se encuentra.
         Exception: Si ocurre un error al leer el archivo CSV.
@@ -23,10 +85,11 @@ class DataCleaner:
         if isinstance(filepath_or_buffer, str): # Si es una ruta de archivo
             if not os.path.exists(filepath_or_buffer):
                 raise FileNotFoundError(f"No se encontró el archivo: {filepath_or_buffer}")
-            self.data = pd.read_csv(filepath_or_buffer)
-        else: 
-            self.data = pd.read_csv(filepath_or_buffer)
+        self.data = _leer_datos(filepath_or_buffer, dtype, columnas)
 
+        # Copia profunda: `cleaned_data` es un atributo público y quien lo use puede editarlo
+        # en sitio (ej. `.loc[...] = ...`); sin copy-on-write, una copia superficial
+        # propagaría esos cambios a `data`.
         self.cleaned_data = self.data.copy()
        
         print(f"Dataset cargado exitosamente con {self.cleaned_data.shape[0]} filas y {self.cleaned_data.shape[1]} columnas.")
@@ -36,10 +99,12 @@ class DataCleaner:
         Genera e imprime un reporte de la cantidad de valores nulos por columna
         en el DataFrame `cleaned_data`.
 
-        pd.Series: Una serie de Pandas donde el índice son los nombres de las columnas
-                       y los valores son la cantidad de nulos en cada una. Solo se incluyen
-                       columnas con al menos un valor nulo.
+        pd.Series: Una serie de Pandas donde el índice son los nombres de todas las columnas
+                       y los valores son la cantidad de nulos en cada una (0 si no tiene).
+                       Solo se imprimen las columnas con al menos un valor nulo.
         """
+        # Un solo conteo vectorizado sobre todo el DataFrame. Filtrar antes con isna().any()
+        # no ahorra trabajo: igual construye la máscara completa de nulos.
         null_report = self.cleaned_data.isnull().sum()
         print("Reporte de valores nulos por columna:")
         print(null_report[null_report > 0])
@@ -66,17 +131,14 @@ class DataCleaner:
             print(f"Advertencia: La columna '{column}' no es numérica. No se pueden detectar outliers con IQR.")
             return pd.DataFrame()
 
-        Q1 = self.cleaned_data[column].quantile(0.25)
-        Q3 = self.cleaned_data[column].quantile(0.75)
-        IQR = Q3 - Q1
+        valores = self.cleaned_data[column].to_numpy(dtype=float, na_value=np.nan)
+        limite_inferior, limite_superior, IQR = _limites_iqr(valores)
 
         if IQR == 0: # Evitar problemas si todos los valores son iguales
             print(f"Rango intercuartílico (IQR) es cero para la columna '{column}'. No se detectarán outliers por este método aquí.")
             return pd.DataFrame()
 
-        limite_inferior = Q1 - 1.5 * IQR
-        limite_superior = Q3 + 1.5 * IQR
-        outliers = self.cleaned_data[(self.cleaned_data[column] < limite_inferior) | (self.cleaned_data[column] > limite_superior)]
+        outliers = self.cleaned_data[(valores < limite_inferior) | (valores > limite_superior)]
         print(f"🔎 Se detectaron {outliers.shape[0]} outliers en la columna '{column}' usando IQR.")
         return outliers
 
@@ -95,21 +157,139 @@ class DataCleaner:
             print(f"Advertencia: La columna '{column}' no es numérica. No se pueden eliminar outliers con IQR.")
             return
 
-        Q1 = self.cleaned_data[column].quantile(0.25)
-        Q3 = self.cleaned_data[column].quantile(0.75)
-        IQR = Q3 - Q1
+        valores = self.cleaned_data[column].to_numpy(dtype=float, na_value=np.nan)
+        limite_inferior, limite_superior, IQR = _limites_iqr(valores)
 
         if IQR == 0:
             print(f"Rango intercuartílico (IQR) es cero para la columna '{column}'. No se eliminarán outliers por este método.")
             return
 
-        limite_inferior = Q1 - 1.5 * IQR
-        limite_superior = Q3 + 1.5 * IQR
         initial_shape = self.cleaned_data.shape
-        self.cleaned_data = self.cleaned_data[(self.cleaned_data[column] >= limite_inferior) & (self.cleaned_data[column] <= limite_superior)]
+        self.cleaned_data = self.cleaned_data[(valores >= limite_inferior) & (valores <= limite_superior)]
         final_shape = self.cleaned_data.shape
         print(f"🧹 Outliers eliminados en '{column}': dataset pasó de {initial_shape[0]} a {final_shape[0]} filas.")
 
+    def detect_and_remove_outliers_iqr(self, column: str) -> pd.DataFrame:
+        """
+        Combina `detect_outliers_iqr` y `remove_outliers_iqr` en una sola pasada:
+        calcula Q1 y Q3 una vez con NumPy, devuelve las filas outlier y elimina de
+        `cleaned_data` las filas fuera de los límites (incluidas las que tienen NaN
+        en la columna, igual que `remove_outliers_iqr`).
+
+        column (str): El nombre de la columna en `cleaned_data` a procesar.
+
+        pd.DataFrame: Las filas identificadas como outliers antes de su eliminación.
+                          Retorna un DataFrame vacío (sin modificar `cleaned_data`) si la columna
+                          no existe, no es numérica, o si el IQR es cero.
+        """
+        if column not in self.cleaned_data.columns:
+            print(f"Advertencia: La columna '{column}' no existe para detectar/eliminar outliers.")
+            return pd.DataFrame()
+        if not pd.api.types.is_numeric_dtype(self.cleaned_data[column]):
+            print(f"Advertencia: La columna '{column}' no es numérica. No se pueden detectar/eliminar outliers con IQR.")
+            return pd.DataFrame()
+
+        valores = self.cleaned_data[column].to_numpy(dtype=float, na_value=np.nan)
+        limite_inferior, limite_superior, IQR = _limites_iqr(valores)
+
+        if IQR == 0:
+            print(f"Rango intercuartílico (IQR) es cero para la columna '{column}'. No se detectarán ni eliminarán outliers por este método.")
+            return pd.DataFrame()
+
+        # Una sola máscara: las filas fuera de ella son outliers, salvo las que tienen NaN
+        # (se eliminan pero no se reportan, igual que con los métodos separados).
+        dentro_limites = (valores >= limite_inferior) & (valores <= limite_superior)
+        outliers = self.cleaned_data[~dentro_limites & ~np.isnan(valores)]
+        filas_antes = self.cleaned_data.shape[0]
+        self.cleaned_data = self.cleaned_data[dentro_limites]
+        print(f"🔎 Se detectaron {outliers.shape[0]} outliers en la columna '{column}' usando IQR.")
+        print(f"🧹 Outliers eliminados en '{column}': dataset pasó de {filas_antes} a {self.cleaned_data.shape[0]} filas.")
+        return outliers
+
+    def detect_and_remove_outliers_iqr_columnas(self, columns: list[str]) -> dict:
+        """
+        Aplica `detect_and_remove_outliers_iqr` a varias columnas en orden, con el mismo
+        resultado que llamarlo una vez por columna (los límites de cada columna se calculan
+        sobre las filas que dejaron las anteriores), pero acumulando una sola máscara y
+        recortando `cleaned_data` una única vez al final.
+
+        columns (list[str]): Las columnas a procesar, en orden.
+                             Las columnas inexistentes o no numéricas se omiten con una advertencia.
+
+        dict: Diccionario {columna: (outliers, filas_antes, filas_despues)} con las columnas
+              procesadas, donde `outliers` son las filas outlier detectadas en esa columna.
+        """
+        resultados = {}
+        mantener = np.ones(self.cleaned_data.shape[0], dtype=bool)
+        filas_actuales = self.cleaned_data.shape[0]
+        for column in columns:
+            if column not in self.cleaned_data.columns:
+                print(f"Advertencia: La columna '{column}' no existe para detectar/eliminar outliers.")
+                continue
+            if not pd.api.types.is_numeric_dtype(self.cleaned_data[column]):
+                print(f"Advertencia: La columna '{column}' no es numérica. No se pueden detectar/eliminar outliers con IQR.")
+                continue
+
+            valores = self.cleaned_data[column].to_numpy(dtype=float, na_value=np.nan)
+            limite_inferior, limite_superior, IQR = _limites_iqr(valores[mantener])
+
+            if IQR == 0:
+                print(f"Rango intercuartílico (IQR) es cero para la columna '{column}'. No se detectarán ni eliminarán outliers por este método.")
+                resultados[column] = (pd.DataFrame(), filas_actuales, filas_actuales)
+                continue
+
+            dentro_limites = (valores >= limite_inferior) & (valores <= limite_superior)
+            outliers = self.cleaned_data[mantener & ~dentro_limites & ~np.isnan(valores)]
+            mantener &= dentro_limites
+            filas_despues = int(mantener.sum())
+            print(f"🔎 Se detectaron {outliers.shape[0]} outliers en la columna '{column}' usando IQR.")
+            print(f"🧹 Outliers eliminados en '{column}': dataset pasó de {filas_actuales} a {filas_despues} filas.")
+            resultados[column] = (outliers, filas_actuales, filas_despues)
+            filas_actuales = filas_despues
+
+        if not mantener.all():
+            self.cleaned_data = self.cleaned_data[mantener]
+        return resultados
+
+    def _columnas_numericas(self, columns: list[str], accion: str) -> list[str]:
+        """
+        Filtra las columnas existentes y numéricas de `cleaned_data`, avisando por cada
+        columna descartada.
+
+        columns (list[str]): Las columnas solicitadas.
+        accion (str): Texto que se agrega a la advertencia (ej. "No normalizada (Min-Max).").
+
+        list[str]: Las columnas válidas, en el orden recibido.
+        """
+        cols_validas = []
+        for col in columns:
+            if col not in self.cleaned_data.columns or not pd.api.types.is_numeric_dtype(self.cleaned_data[col]):
+                print(f"Advertencia: Columna '{col}' no es numérica o no existe. {accion}")
+                continue
+            cols_validas.append(col)
+        return cols_validas
+
+    def _asignar_escaladas(self, columnas: list[str], matriz: np.ndarray,
+                           centros: np.ndarray, escalas: np.ndarray) -> None:
+        """
+        Asigna a `columnas` el resultado de `(matriz - centros) / escalas` calculado por
+        columnas con broadcasting. Las columnas con escala cero se establecen a 0.
+
+        columnas (list[str]): Las columnas de `cleaned_data` que corresponden a `matriz`.
+        matriz (np.ndarray): Los valores de las columnas (filas x columnas, float).
+        centros (np.ndarray): El valor a restar a cada columna.
+        escalas (np.ndarray): El divisor de cada columna.
+        """
+        constantes = escalas == 0
+        if not constantes.all():
+            escalables = ~constantes
+            matriz = matriz[:, escalables]
+            matriz -= centros[escalables]
+            matriz /= escalas[escalables]
+            self.cleaned_data[[c for c, e in zip(columnas, escalables) if e]] = matriz
+        if constantes.any():
+            self.cleaned_data[[c for c, k in zip(columnas, constantes) if k]] = 0
+
     def normalize_minmax(self, columns: list[str]) -> None:
         """
         Aplica la normalización Min-Max a las columnas numéricas especificadas en `cleaned_data`.
@@ -119,16 +299,13 @@ class DataCleaner:
         columns (list[str]): Una lista de nombres de columnas a normalizar.
                                  Las columnas no numéricas o no existentes serán ignoradas con una advertencia.
         """
-        for col in columns:
-            if col not in self.cleaned_data.columns or not pd.api.types.is_numeric_dtype(self.cleaned_data[col]):
-                print(f"Advertencia: Columna '{col}' no es numérica o no existe. No normalizada (Min-Max).")
-                continue
-            min_val = self.cleaned_data[col].min()
-            max_val = self.cleaned_data[col].max()
-            if max_val - min_val == 0:
-                self.cleaned_data[col] = 0
-            else:
-                self.cleaned_data[col] = (self.cleaned_data[col] - min_val) / (max_val - min_val)
+        cols_validas = self._columnas_numericas(columns, "No normalizada (Min-Max).")
+        if cols_validas:
+            # Mínimos y máximos de todas las columnas en una sola operación sobre la matriz.
+            matriz = self.cleaned_data[cols_validas].to_numpy(dtype=float, na_value=np.nan)
+            minimos = np.nanmin(matriz, axis=0)
+            rangos = np.nanmax(matriz, axis=0) - minimos
+            self._asignar_escaladas(cols_validas, matriz, minimos, rangos)
         print(f"🔄 Normalización Min-Max aplicada (donde fue posible) a: {columns}")
 
     def standardize_zscore(self, columns: list[str]) -> None:
@@ -138,23 +315,24 @@ class DataCleaner:
         Si una columna tiene una desviación estándar de 0, sus valores se establecen a 0.
 
         """
-        for col in columns:
-            if col not in self.cleaned_data.columns or not pd.api.types.is_numeric_dtype(self.cleaned_data[col]):
-                print(f"Advertencia: Columna '{col}' no es numérica o no existe. No estandarizada (Z-Score).")
-                continue
-            mean_val = self.cleaned_data[col].mean()
-            std_val = self.cleaned_data[col].std()
-            if std_val == 0:
-                self.cleaned_data[col] = 0
-            else:
-                self.cleaned_data[col] = (self.cleaned_data[col] - mean_val) / std_val
+        cols_validas = self._columnas_numericas(columns, "No estandarizada (Z-Score).")
+        if cols_validas:
+            # Medias y desviaciones (muestrales, como Series.std) de todas las columnas a la vez.
+            matriz = self.cleaned_data[cols_validas].to_numpy(dtype=float, na_value=np.nan)
+            self._asignar_escaladas(cols_validas, matriz, np.nanmean(matriz, axis=0),
+                                    np.nanstd(matriz, axis=0, ddof=1))
         print(f"📈 Estandarización Z-Score aplicada (donde fue posible) a: {columns}")
 
-    def one_hot_encode(self, columns: list[str]) -> None:
+    def one_hot_encode(self, columns: list[str], sparse: bool = False) -> None:
         """
         Aplica One-Hot Encoding a las columnas categóricas especificadas en `cleaned_data`.
         Esto crea nuevas columnas binarias para cada categoría única en las columnas originales.
+        Las columnas indicadoras se generan como uint8 (1 byte por valor).
 
+        columns (list[str]): Las columnas a codificar.
+        sparse (bool, optional): Si es True, las columnas indicadoras se guardan como
+                                 `SparseArray` (solo se almacenan los unos), útil con muchas
+                                 categorías. Por defecto es False.
         """
         valid_cols_to_encode = [col for col in columns if col in self.cleaned_data.columns]
         if not valid_cols_to_encode:
@@ -162,15 +340,57 @@ class DataCleaner:
             return
 
         print(f"Aplicando One-Hot Encoding a: {valid_cols_to_encode}")
-        self.cleaned_data = pd.get_dummies(self.cleaned_data, columns=valid_cols_to_encode, drop_first=False)
+        self.cleaned_data = pd.get_dummies(self.cleaned_data, columns=valid_cols_to_encode, drop_first=False,
+                                           dtype=np.uint8, sparse=sparse)
         print(f"🏷️ One-Hot Encoding completado.")
 
+    def compress_dtypes(self, umbral_categoria: float = 0.5) -> None:
+        """
+        Reduce el tamaño en memoria de `cleaned_data` sin perder información: las columnas
+        enteras pasan al entero más pequeño que contiene sus valores, las de punto flotante
+        a float32 solo si todos sus valores se recuperan exactos al volver a float64 (en la
+        práctica, enteros o fracciones binarias como 0.5; no 45.37), y las de texto con pocos
+        valores distintos a `category`.
+
+        umbral_categoria (float, optional): Fracción máxima de valores únicos respecto al número
+                                            de filas para convertir una columna de texto a
+                                            `category`. Por defecto es 0.5.
+        """
+        bytes_antes = self.cleaned_data.memory_usage(deep=True).sum()
+        n_filas = self.cleaned_data.shape[0]
+        for col, serie in self.cleaned_data.items():
+            if not isinstance(serie.dtype, np.dtype):
+                continue # Categóricas, Arrow o enteros con máscara se dejan como están.
+            if serie.dtype.kind in "iu":
+                self.cleaned_data[col] = pd.to_numeric(serie, downcast="integer")
+            elif serie.dtype.kind == "f" and serie.dtype.itemsize > 4:
+                # `pd.to_numeric(downcast="float")` acepta diferencias de hasta ~5e-4, así que
+                # solo se pasa a float32 si todos los valores vuelven exactos a float64.
+                valores = serie.to_numpy()
+                valores_32 = valores.astype(np.float32)
+                if np.array_equal(valores_32.astype(valores.dtype), valores, equal_nan=True):
+                    self.cleaned_data[col] = pd.Series(valores_32, index=serie.index, name=col)
+            elif serie.dtype.kind == "O" and serie.nunique() < umbral_categoria * n_filas:
+                self.cleaned_data[col] = serie.astype("category")
+        bytes_despues = self.cleaned_data.memory_usage(deep=True).sum()
+        print(f"🗜️ Tipos de datos reducidos: memoria de {bytes_antes / 1024:.1f} KB a {bytes_despues / 1024:.1f} KB.")
+
     def save_clean_data(self, output_path: str) -> None:
         """
-        Guarda el DataFrame `cleaned_data` en un archivo CSV.
+        Guarda el DataFrame `cleaned_data` en un archivo, eligiendo el formato según la extensión:
+        `.csv` escribe CSV; `.feather`/`.arrow` escribe Arrow IPC; cualquier otra (o ninguna)
+        escribe Parquet comprimido con zstd, que conserva los tipos y evita convertir cada
+        valor a texto.
 
+        output_path (str): Ruta del archivo de salida.
         """
-        self.cleaned_data.to_csv(output_path, index=False)
+        extension = os.path.splitext(output_path)[1].lower()
+        if extension == ".csv":
+            self.cleaned_data.to_csv(output_path, index=False)
+        elif extension in (".feather", ".arrow"):
+            self.cleaned_data.reset_index(drop=True).to_feather(output_path, compression="zstd")
+        else:
+            self.cleaned_data.to_parquet(output_path, index=False, compression="zstd")
         print(f"💾 Dataset limpio guardado exitosamente en: {output_path}")
 
     def rellenar_con_mediana(self, columna: str) -> None:
@@ -187,14 +407,49 @@ class DataCleaner:
         if not pd.api.types.is_numeric_dtype(self.cleaned_data[columna]):
             print(f"⚠️ La columna '{columna}' no es numérica. No se puede calcular la mediana.")
             return
-        if self.cleaned_data[columna].isnull().sum() == 0:
+        # La máscara de nulos se calcula una vez y sirve para el chequeo, para la mediana
+        # (sobre los valores no nulos) y para la imputación.
+        serie = self.cleaned_data[columna]
+        valores = serie.to_numpy(dtype=float, na_value=np.nan)
+        nulos = np.isnan(valores)
+        if not nulos.any():
             print(f"ℹ️ No hay valores nulos en '{columna}' para rellenar.")
             return
 
-        mediana = self.cleaned_data[columna].median()
-        self.cleaned_data[columna].fillna(mediana, inplace=True)
+        mediana = float(np.median(valores[~nulos])) if not nulos.all() else np.nan
+        self.cleaned_data[columna] = serie.where(~nulos, mediana)
         print(f"✔ Valores nulos en '{columna}' imputados con la mediana: {mediana}")
 
+    def rellenar_columnas_con_mediana(self, columnas: list[str]) -> dict:
+        """
+        Rellena los valores nulos de varias columnas numéricas con sus medianas en una sola
+        operación: los conteos de nulos y las medianas se calculan una vez sobre el bloque
+        de columnas y la imputación se hace con un único `fillna`.
+
+        columnas (list[str]): Los nombres de las columnas a imputar.
+                              Las columnas inexistentes, no numéricas o sin nulos se omiten.
+
+        dict: Diccionario {columna: (nulos_rellenados, mediana_usada)} con las columnas imputadas.
+        """
+        cols_validas = [c for c in columnas if c in self.cleaned_data.columns
+                        and pd.api.types.is_numeric_dtype(self.cleaned_data[c])]
+        if not cols_validas:
+            return {}
+
+        bloque = self.cleaned_data[cols_validas]
+        nulos = bloque.isnull().sum()
+        cols_con_nulos = nulos[nulos > 0].index
+        if cols_con_nulos.empty:
+            return {}
+
+        # Solo se reescriben las columnas con nulos; el resto del DataFrame no se copia.
+        bloque_con_nulos = bloque[cols_con_nulos]
+        medianas = bloque_con_nulos.median()
+        self.cleaned_data[list(cols_con_nulos)] = bloque_con_nulos.fillna(medianas)
+        for col in cols_con_nulos:
+            print(f"✔ Valores nulos en '{col}' imputados con la mediana: {medianas[col]}")
+        return {col: (int(nulos[col]), float(medianas[col])) for col in cols_con_nulos}
+
     def rellenar_con_moda(self, columna: str) -> None:
         """
         Rellena los valores nulos (NaN) en una columna especificada de `cleaned_data`
@@ -208,17 +463,19 @@ class DataCleaner:
         if columna not in self.cleaned_data.columns:
             print(f"⚠️ La columna '{columna}' no existe en el DataFrame.")
             return
-        if self.cleaned_data[columna].isnull().sum() == 0:
+        serie = self.cleaned_data[columna]
+        cantidad_nulos = _contar_nulos(serie) # Un solo conteo para ambos chequeos.
+        if cantidad_nulos == 0:
             print(f"ℹ️ No hay valores nulos en '{columna}' para rellenar.")
             return
-        if self.cleaned_data[columna].isnull().all():
+        if cantidad_nulos == serie.shape[0]:
             print(f"⚠️ La columna '{columna}' está completamente vacía. No se puede calcular la moda.")
             return
 
-        moda_series = self.cleaned_data[columna].mode()
+        moda_series = serie.mode()
         if not moda_series.empty:
             moda_val = moda_series[0]
-            self.cleaned_data[columna].fillna(moda_val, inplace=True)
+            self.cleaned_data[columna] = serie.fillna(moda_val)
             print(f"✔ Valores nulos en '{columna}' imputados con la moda: {moda_val}")
         else:
             print(f"⚠️ No se pudo determinar la moda para la columna '{columna}'.")
@@ -231,7 +488,7 @@ class DataCleaner:
                            No hace nada si la columna no existe.
         """
         if columna in self.cleaned_data.columns:
-            self.cleaned_data.drop(columns=[columna], inplace=True)
+            self.cleaned_data = self.cleaned_data.drop(columns=[columna])
             print(f"❌ Columna '{columna}' eliminada correctamente.")
         else:
             print(f"⚠️ La columna '{columna}' no existe en el DataFrame.")
@@ -248,7 +505,8 @@ class DataCleaner:
         """
         if columna in self.cleaned_data.columns:
             filas_antes = self.cleaned_data.shape[0]
-            self.cleaned_data.dropna(subset=[columna], inplace=True)
+            if _contar_nulos(self.cleaned_data[columna]) > 0: # Sin nulos no se copia el DataFrame.
+                self.cleaned_data = self.cleaned_data.dropna(subset=[columna])
             filas_despues = self.cleaned_data.shape[0]
             eliminadas = filas_antes - filas_despues
             print(f"🧹 Se eliminaron {eliminadas} filas con nulos en la columna '{columna}'.")
@@ -274,11 +532,19 @@ class DataCleaner:
         if not pd.api.types.is_numeric_dtype(self.cleaned_data[column]):
             print(f"Advertencia: La columna '{column}' no es numérica para Z-score.")
             return pd.DataFrame()
-        if self.cleaned_data[column].std() == 0:
+        # Media y desviación estándar (muestral, como Series.std) se calculan una sola vez
+        # sobre el arreglo NumPy y se reutilizan para los Z-scores.
+        valores = self.cleaned_data[column].to_numpy(dtype=float, na_value=np.nan)
+        desviacion = np.nanstd(valores, ddof=1)
+        if desviacion == 0:
             print(f"⚠️ La desviación estándar de '{column}' es cero. No se pueden calcular Z-scores.")
             return pd.DataFrame()
 
-        z_scores = np.abs((self.cleaned_data[column] - self.cleaned_data[column].mean()) / self.cleaned_data[column].std())
+        # Un único arreglo temporal: la resta lo crea y el valor absoluto y la división
+        # se aplican en sitio (`valores` puede ser una vista de la columna y no se toca).
+        z_scores = valores - np.nanmean(valores)
+        np.abs(z_scores, out=z_scores)
+        z_scores /= desviacion
         outliers = self.cleaned_data[z_scores > threshold]
         print(f"🔎 Se detectaron {outliers.shape[0]} outliers en '{column}' (Z-score > {threshold}).")
         return outliers
@@ -300,15 +566,27 @@ class DataCleaner:
         pd.Series: Una nueva serie con los textos normalizados.
                        Si un elemento de la serie no es una cadena, se devuelve tal cual.
         """
-        def _normalize(texto: str | any) -> str | any:
-            """Función auxiliar para normalizar un único texto."""
-            if isinstance(texto, str):
-                texto = texto.lower()
-                texto = unicodedata.normalize('NFKD', texto).encode('ASCII', 'ignore').decode('utf-8')
-                texto = ' '.join(texto.split()) # Elimina espacios extra y saltos de línea
-                return texto
-            return texto # Devuelve el valor original si no es string (ej. NaN)
-        return texto_series.apply(_normalize)
+        if not (pd.api.types.is_object_dtype(texto_series) or pd.api.types.is_string_dtype(texto_series)):
+            return texto_series.copy() # Sin textos que normalizar (ej. columna numérica).
+
+        def _normalizar(texto: str) -> str:
+            """Normaliza un único texto."""
+            texto = unicodedata.normalize('NFKD', texto.lower()).encode('ASCII', 'ignore').decode('utf-8')
+            return ' '.join(texto.split()) # Elimina espacios extra y saltos de línea
+
+        def _normalizar_valor(valor):
+            return _normalizar(valor) if isinstance(valor, str) else valor
+
+        if isinstance(texto_series.dtype, pd.CategoricalDtype):
+            # Se normalizan solo las categorías (una vez cada una) y se recodifica: si dos
+            # categorías quedan iguales tras normalizar, Pandas devuelve una serie de tipo object.
+            return texto_series.map(_normalizar_valor)
+
+        # Una sola pasada en Python por elemento (la cadena de métodos `.str` recorre la serie
+        # una vez por paso y resulta más lenta sobre columnas de tipo object). Los valores que
+        # no son cadenas (ej. NaN o números) se devuelven tal cual.
+        return pd.Series([_normalizar_valor(x) for x in texto_series],
+                         index=texto_series.index, name=texto_series.name, dtype=texto_series.dtype)
 
     def replace_unknown_error(self, column: str) -> None:
         """
@@ -326,5 +604,12 @@ class DataCleaner:
             print(f"⚠️ La columna '{column}' no existe para reemplazar 'UNKNOWN' y 'ERROR'.")
             return
         # Se reemplazan directamente. Para manejo de may/min, normalizar antes.
-        self.cleaned_data[column] = self.cleaned_data[column].replace(['UNKNOWN', 'ERROR'], np.nan)
+        serie = self.cleaned_data[column]
+        if isinstance(serie.dtype, pd.CategoricalDtype):
+            # En una categórica basta con quitar esas categorías del diccionario (O(k) en
+            # lugar de recorrer las N filas): sus códigos pasan a NaN.
+            self.cleaned_data[column] = serie.cat.remove_categories(
+                serie.cat.categories.intersection(['UNKNOWN', 'ERROR']))
+        else:
+            self.cleaned_data[column] = serie.replace(['UNKNOWN', 'ERROR'], np.nan)
         print(f"✔ Se reemplazó 'UNKNOWN' y 'ERROR' en '{column}' por NaN (si existían).")
\ No newline at end of file
@@ -1,6 +1,11 @@
 import numpy as np 
 
 class Registro:
+    # Atributos fijos: sin `__dict__` por instancia (menos memoria por registro y acceso
+    # a atributos más directo al recorrer listas grandes de registros).
+    __slots__ = ("id", "proyecto", "area", "equipo", "costo_estimado", "costo_real",
+                 "avance_estimado", "avance_real", "trabajadores")
+
     def __init__(self, id, proyecto, area, equipo, costo_estimado, costo_real, avance_estimado, avance_real, trabajadores):
   
         self.id = id
@@ -57,6 +62,46 @@ class Registro:
         return alertas
 
 
+def _alertas_en_bloque(registros: list[Registro], umbral_sobrecosto_porcentual: float = 20.0,
+                       umbral_baja_eficiencia: float = 80.0) -> dict[int, list[str]]:
+    """
+    Evalúa `Registro.alerta_sobreuso_recursos` para una lista de registros con máscaras
+    NumPy: los costos y avances se leen una vez en arreglos, las condiciones se calculan
+    para todos a la vez y los mensajes solo se formatean para los registros con alertas.
+
+    registros (list[Registro]): Los registros a evaluar.
+    umbral_sobrecosto_porcentual (float): Igual que en `alerta_sobreuso_recursos`.
+    umbral_baja_eficiencia (float): Igual que en `alerta_sobreuso_recursos`.
+
+    dict[int, list[str]]: {posición en `registros`: alertas} solo para los registros con alertas,
+                          con los mismos mensajes que `alerta_sobreuso_recursos`.
+    """
+    n = len(registros)
+    ce = np.fromiter((r.costo_estimado for r in registros), dtype=np.float64, count=n)
+    cr = np.fromiter((r.costo_real for r in registros), dtype=np.float64, count=n)
+    ae = np.fromiter((r.avance_estimado for r in registros), dtype=np.float64, count=n)
+    ar = np.fromiter((r.avance_real for r in registros), dtype=np.float64, count=n)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        porcentaje_sobrecosto = np.where(ce > 0, (cr - ce) / ce * 100, np.nan)
+        eficiencia = np.where(ae == 0, 100.0, ar / ae * 100)
+    con_sobrecosto = porcentaje_sobrecosto > umbral_sobrecosto_porcentual
+    no_previsto = (ce <= 0) & (cr > ce)
+    baja_eficiencia = (ae > 0) & (eficiencia < umbral_baja_eficiencia)
+
+    alertas = {}
+    for i in np.flatnonzero(con_sobrecosto | no_previsto | baja_eficiencia).tolist():
+        alertas_reg = []
+        if con_sobrecosto[i]:
+            alertas_reg.append(f"Sobrecosto del {porcentaje_sobrecosto[i]:.2f}%")
+        elif no_previsto[i]:
+            alertas_reg.append(f"Costo Real ${cr[i]:,.0f} vs Estimado $0 (Costo no previsto)")
+        if baja_eficiencia[i]:
+            alertas_reg.append(f"Baja eficiencia: {eficiencia[i]:.2f}%")
+        alertas[i] = alertas_reg
+    return alertas
+
+
 class Proyecto:
     """
     Representa un proyecto que agrupa múltiples registros, áreas y equipos.
@@ -83,15 +128,17 @@ class Proyecto:
 
        
         if registro.area: # Asegura que el registro tenga un área definida.
-            if registro.area not in self.areas:
-                self.areas[registro.area] = Area(registro.area)
-            self.areas[registro.area].agregar_registro(registro)
+            area = self.areas.get(registro.area) # Una búsqueda en el dict (dos solo al crearla).
+            if area is None:
+                area = self.areas[registro.area] = Area(registro.area)
+            area.agregar_registro(registro)
 
       
         if registro.equipo: # Asegura que el registro tenga un equipo definido.
-            if registro.equipo not in self.equipos:
-                self.equipos[registro.equipo] = Equipo(registro.equipo)
-            self.equipos[registro.equipo].agregar_registro(registro)
+            equipo = self.equipos.get(registro.equipo)
+            if equipo is None:
+                equipo = self.equipos[registro.equipo] = Equipo(registro.equipo)
+            equipo.agregar_registro(registro)
 
     def costo_total_estimado(self) -> float:
       
@@ -103,7 +150,12 @@ class Proyecto:
 
     def desviacion_presupuesto(self) -> float:
       
-        return self.costo_total_real() - self.costo_total_estimado()
+        # Ambos totales en un solo recorrido de los registros.
+        total_estimado = total_real = 0.0
+        for r in self.registros:
+            total_estimado += r.costo_estimado
+            total_real += r.costo_real
+        return total_real - total_estimado
 
     def rendimiento_promedio(self) -> float:
      
@@ -117,10 +169,9 @@ class Proyecto:
     def obtener_alertas_proyecto(self, **kwargs) -> dict:
       
         alertas_proyecto = {}
-        for reg in self.registros:
-            alertas_reg = reg.alerta_sobreuso_recursos(**kwargs)
-            if alertas_reg:
-                alertas_proyecto[f"Reg.ID {reg.id} (Eq:{reg.equipo}, Área:{reg.area})"] = alertas_reg
+        for i, alertas_reg in _alertas_en_bloque(self.registros, **kwargs).items():
+            reg = self.registros[i]
+            alertas_proyecto[f"Reg.ID {reg.id} (Eq:{reg.equipo}, Área:{reg.area})"] = alertas_reg
         return alertas_proyecto
 
 class Area:
@@ -164,10 +215,9 @@ class Area:
     def obtener_alertas_area(self, **kwargs) -> dict:
      
         alertas_area = {}
-        for reg in self.registros:
-            alertas_reg = reg.alerta_sobreuso_recursos(**kwargs)
-            if alertas_reg:
-                alertas_area[f"Reg.ID {reg.id} (Proy:{reg.proyecto}, Eq:{reg.equipo})"] = alertas_reg
+        for i, alertas_reg in _alertas_en_bloque(self.registros, **kwargs).items():
+            reg = self.registros[i]
+            alertas_area[f"Reg.ID {reg.id} (Proy:{reg.proyecto}, Eq:{reg.equipo})"] = alertas_reg
         return alertas_area
 
 class Equipo:
@@ -223,7 +273,11 @@ class Indicadores:
     @staticmethod
     def ranking_proyectos_por_sobrecosto(proyectos_list: list[Proyecto]) -> list[Proyecto]:
       
-        return sorted(proyectos_list, key=lambda p: p.desviacion_presupuesto(), reverse=True)
+        # Las desviaciones se calculan una vez por proyecto en un arreglo float64 y se ordenan
+        # con argsort estable (los empates conservan el orden de entrada, como `sorted`).
+        desviaciones = np.fromiter((p.desviacion_presupuesto() for p in proyectos_list),
+                                   dtype=np.float64, count=len(proyectos_list))
+        return [proyectos_list[i] for i in np.argsort(-desviaciones, kind="stable")]
 
     @staticmethod
     def eficiencia_general(registros_list: list[Registro]) -> float:
@@ -232,3 +286,22 @@ class Indicadores:
         # para un cálculo de eficiencia promedio más significativo.
         eficiencias_validas = [r.eficiencia() for r in registros_list if r.avance_estimado > 0]
         return sum(eficiencias_validas) / len(eficiencias_validas) if eficiencias_validas else 0.0
+
+    @staticmethod
+    def eficiencia_general_vec(avance_real: np.ndarray, avance_estimado: np.ndarray) -> float:
+        """
+        Versión vectorizada de `eficiencia_general` que opera directamente sobre
+        arreglos NumPy (por ejemplo, columnas de un DataFrame) sin construir objetos Registro.
+        Los NaN se tratan como 0, igual que en `Registro`.
+
+        avance_real (np.ndarray): Avance real de cada registro.
+        avance_estimado (np.ndarray): Avance estimado de cada registro.
+
+        float: La eficiencia promedio (%) de los registros con avance_estimado > 0.
+        """
+        real = np.nan_to_num(np.asarray(avance_real, dtype=float))
+        estimado = np.nan_to_num(np.asarray(avance_estimado, dtype=float))
+        validos = estimado > 0
+        if not validos.any():
+            return 0.0
+        return float((real[validos] / estimado[validos]).mean() * 100)
@@ -0,0 +1,242 @@
+import pytest
+import sys
+import os
+import io
+import numpy as np
+import pandas as pd
+
+
+# Agrega el directorio padre al sys.path 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_cleaner import DataCleaner # Importa la clase DataCleaner que se va a probar.
+
+CSV_PRUEBA = """id,proyecto,costo_real
+1,A,10
+2,A,11
+3,B,12
+4,B,13
+5,C,
+6,C,14
+7,A,500
+"""
+
+# --- Clase de Pruebas para la clase DataCleaner ---
+
+class TestDataCleaner:
+    """
+    Clase que agrupa pruebas unitarias para la clase `DataCleaner`.
+    """
+
+    def test_detect_and_remove_outliers_iqr_equivale_a_metodos_separados(self):
+        """
+        Verifica que la pasada combinada detecte los mismos outliers que `detect_outliers_iqr`
+        y deje `cleaned_data` igual que `remove_outliers_iqr` (que también descarta los NaN).
+        """
+        separado = DataCleaner(io.StringIO(CSV_PRUEBA))
+        outliers_esperados = separado.detect_outliers_iqr("costo_real")
+        separado.remove_outliers_iqr("costo_real")
+
+        combinado = DataCleaner(io.StringIO(CSV_PRUEBA))
+        outliers = combinado.detect_and_remove_outliers_iqr("costo_real")
+
+        assert outliers["id"].tolist() == outliers_esperados["id"].tolist() == [7]
+        assert combinado.cleaned_data["id"].tolist() == separado.cleaned_data["id"].tolist()
+        assert 5 not in combinado.cleaned_data["id"].tolist()
+
+    def test_detect_and_remove_outliers_iqr_columna_invalida(self):
+        """
+        Verifica que una columna inexistente o no numérica no modifique los datos.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        assert cleaner.detect_and_remove_outliers_iqr("no_existe").empty
+        assert cleaner.detect_and_remove_outliers_iqr("proyecto").empty
+        assert cleaner.cleaned_data.shape[0] == 7
+
+    def test_rellenar_columnas_con_mediana(self):
+        """
+        Verifica que la imputación en bloque use la mediana de cada columna, informe los
+        nulos rellenados y omita columnas sin nulos, no numéricas o inexistentes.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        mediana_esperada = cleaner.cleaned_data["costo_real"].median()
+
+        imputaciones = cleaner.rellenar_columnas_con_mediana(["costo_real", "id", "proyecto", "no_existe"])
+
+        assert imputaciones == {"costo_real": (1, mediana_esperada)}
+        assert cleaner.cleaned_data["costo_real"].isnull().sum() == 0
+        assert cleaner.cleaned_data.loc[cleaner.cleaned_data["id"] == 5, "costo_real"].item() == mediana_esperada
+
+    def test_detect_and_remove_outliers_iqr_columnas_equivale_a_pasadas_sucesivas(self):
+        """
+        Verifica que la máscara combinada produzca los mismos outliers y el mismo
+        `cleaned_data` que aplicar `detect_and_remove_outliers_iqr` columna por columna.
+        """
+        csv = "id,a,b\n" + "".join(f"{i},{10 + i % 5},{i * 2}\n" for i in range(1, 21)) + "21,900,5\n22,12,800\n23,,7\n"
+        sucesivo = DataCleaner(io.StringIO(csv))
+        outliers_a = sucesivo.detect_and_remove_outliers_iqr("a")
+        outliers_b = sucesivo.detect_and_remove_outliers_iqr("b")
+
+        combinado = DataCleaner(io.StringIO(csv))
+        resultados = combinado.detect_and_remove_outliers_iqr_columnas(["a", "no_existe", "b"])
+
+        assert list(resultados) == ["a", "b"]
+        assert resultados["a"][0]["id"].tolist() == outliers_a["id"].tolist()
+        assert resultados["b"][0]["id"].tolist() == outliers_b["id"].tolist()
+        assert resultados["b"][2] == sucesivo.cleaned_data.shape[0]
+        assert combinado.cleaned_data["id"].tolist() == sucesivo.cleaned_data["id"].tolist()
+
+    def test_no_reemplaza_csv_por_parquet_hermano(self, tmp_path):
+        """
+        Verifica que un Parquet con el mismo nombre junto al CSV (por ejemplo, la salida de
+        `save_clean_data`) no reemplace al CSV al cargarlo, y que un `.parquet` indicado
+        explícitamente se lea directamente.
+        """
+        ruta_csv = tmp_path / "datos.csv"
+        ruta_csv.write_text(CSV_PRUEBA)
+        cleaner = DataCleaner(str(ruta_csv))
+        cleaner.remove_outliers_iqr("costo_real")
+        cleaner.save_clean_data(str(tmp_path / "datos.parquet"))
+
+        recargado = DataCleaner(str(ruta_csv))
+        assert recargado.data.shape[0] == 7
+        assert DataCleaner(str(tmp_path / "datos.parquet")).data.shape[0] == cleaner.cleaned_data.shape[0]
+
+    def test_metodos_no_modifican_los_datos_originales(self):
+        """
+        Verifica que ni los métodos de limpieza ni una edición en sitio de `cleaned_data`
+        alteren los datos originales.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        originales = cleaner.data.copy()
+
+        cleaner.cleaned_data.loc[0, "id"] = 99
+        cleaner.rellenar_con_mediana("costo_real")
+        cleaner.normalize_minmax(["costo_real"])
+        cleaner.eliminar_columna("proyecto")
+
+        assert cleaner.data.equals(originales)
+        assert "proyecto" not in cleaner.cleaned_data.columns
+
+    def test_normalizar_texto(self):
+        """
+        Verifica la normalización: minúsculas, sin tildes, espacios colapsados, subclases
+        de str tratadas como texto y valores que no son texto devueltos sin cambios.
+        """
+        class Texto(str):
+            pass
+
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        serie = pd.Series(["  Ingeniería  Civil\n", "ÑANDÚ", np.nan, 5, Texto("Árbol y\tRío")])
+
+        resultado = cleaner.normalizar_texto(serie)
+
+        assert resultado.tolist()[:2] == ["ingenieria civil", "nandu"]
+        assert np.isnan(resultado[2])
+        assert resultado.tolist()[3:] == [5, "arbol y rio"]
+
+    def test_normalizar_texto_categorica(self):
+        """
+        Verifica que en una serie categórica se normalicen los textos (no se pierden como NaN),
+        incluso cuando dos categorías quedan iguales tras normalizar.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        serie = pd.Series(["Ármando ", " JOSÉ", "x", np.nan], dtype="category")
+
+        resultado = cleaner.normalizar_texto(serie)
+
+        assert resultado.tolist()[:3] == ["armando", "jose", "x"]
+        assert pd.isna(resultado[3])
+        fusionadas = cleaner.normalizar_texto(pd.Series(["Ármando", "armando"], dtype="category"))
+        assert fusionadas.tolist() == ["armando", "armando"]
+
+    def test_normalize_minmax_y_zscore_por_bloque(self):
+        """
+        Verifica que el escalado por bloque coincida con la fórmula columna a columna
+        y que las columnas constantes queden en 0.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        cleaner.cleaned_data["constante"] = 3.0
+        costo = cleaner.cleaned_data["costo_real"]
+        esperado_minmax = (costo - costo.min()) / (costo.max() - costo.min())
+
+        cleaner.normalize_minmax(["costo_real", "proyecto", "constante"])
+
+        pd.testing.assert_series_equal(cleaner.cleaned_data["costo_real"], esperado_minmax)
+        assert (cleaner.cleaned_data["constante"] == 0).all()
+
+        ids = cleaner.cleaned_data["id"]
+        esperado_zscore = (ids - ids.mean()) / ids.std()
+        cleaner.standardize_zscore(["id"])
+        pd.testing.assert_series_equal(cleaner.cleaned_data["id"], esperado_zscore)
+
+    def test_compress_dtypes_sin_perdida(self):
+        """
+        Verifica que la reducción de tipos achique enteros y texto repetido, y que los
+        flotantes que no caben exactamente en float32 se mantengan en float64.
+        """
+        cleaner = DataCleaner(io.StringIO(CSV_PRUEBA))
+        cleaner.cleaned_data["monto"] = [13215204.66, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+        cleaner.cleaned_data["avance"] = [69.59, 45.37, 50.0, 12.5, 80.0, 99.91, 100.0]
+        cleaner.cleaned_data["fraccion"] = [0.5, 1.25, 2.0, 3.75, np.nan, 5.5, 6.0]
+        originales = cleaner.cleaned_data.copy()
+
+        cleaner.compress_dtypes()
+
+        tipos = cleaner.cleaned_data.dtypes
+        assert tipos["id"] == np.int8
+        assert tipos["proyecto"] == "category"
+        assert tipos["costo_real"] == np.float32
+        assert tipos["fraccion"] == np.float32
+        assert tipos["monto"] == np.float64
+        assert tipos["avance"] == np.float64
+        assert cleaner.cleaned_data["avance"].tolist()[:2] == [69.59, 45.37]
+        pd.testing.assert_frame_equal(cleaner.cleaned_data, originales, check_dtype=False, check_categorical=False)
+
+    def test_carga_solo_columnas_indicadas(self, tmp_path):
+        """
+        Verifica que `columnas` limite la lectura tanto desde CSV (ruta o buffer) como desde Parquet.
+        """
+        ruta_csv = tmp_path / "datos.csv"
+        ruta_csv.write_text(CSV_PRUEBA)
+
+        desde_ruta = DataCleaner(str(ruta_csv), columnas=["id", "costo_real"]).data
+        desde_buffer = DataCleaner(io.StringIO(CSV_PRUEBA), columnas=["id", "costo_real"]).data
+        desde_ruta.to_parquet(tmp_path / "datos.parquet")
+        desde_parquet = DataCleaner(str(tmp_path / "datos.parquet"), columnas=["costo_real"]).data
+
+        assert desde_ruta.columns.tolist() == desde_buffer.columns.tolist() == ["id", "costo_real"]
+        assert desde_ruta.equals(desde_buffer)
+        assert desde_parquet.columns.tolist() == ["costo_real"]
+
+    def test_parquet_con_columnas_y_esquema_completo(self, tmp_path):
+        """
+        Verifica que al leer un Parquet con `columnas`, un `dtype` que también nombra columnas
+        no cargadas no falle (como ocurre con el CSV) y se aplique a las cargadas.
+        """
+        ruta_parquet = tmp_path / "datos.parquet"
+        DataCleaner(io.StringIO(CSV_PRUEBA)).data.to_parquet(ruta_parquet)
+        esquema = {"id": "int32", "proyecto": "string", "costo_real": "float32"}
+
+        desde_parquet = DataCleaner(str(ruta_parquet), dtype=esquema, columnas=["id", "costo_real"]).data
+        desde_csv = DataCleaner(io.StringIO(CSV_PRUEBA), dtype=esquema, columnas=["id", "costo_real"]).data
+
+        assert desde_parquet.dtypes.tolist() == [np.int32, np.float32]
+        pd.testing.assert_frame_equal(desde_parquet, desde_csv)
+
+    def test_celdas_vacias_de_texto_se_leen_como_nulos(self, tmp_path):
+        """
+        Verifica que las celdas vacías o con marcadores de nulo ("None", "<NA>") en una
+        columna de texto se lean como NaN, igual desde una ruta que desde un buffer.
+        """
+        csv = "id,equipo\n1,E1\n2,\n3,None\n4,<NA>\n5,E2\n"
+        ruta_csv = tmp_path / "datos.csv"
+        ruta_csv.write_text(csv)
+
+        desde_ruta = DataCleaner(str(ruta_csv))
+        desde_buffer = DataCleaner(io.StringIO(csv))
+
+        assert desde_ruta.report_nulls()["equipo"] == 3
+        assert desde_ruta.data.equals(desde_buffer.data)
+        desde_ruta.eliminar_filas_nulo("equipo")
+        assert desde_ruta.cleaned_data["id"].tolist() == [1, 5]
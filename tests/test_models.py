@@ -7,7 +7,7 @@ import numpy as np
 # Agrega el directorio padre al sys.path 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from models import Registro # Importa la clase Registro que se va a probar.
+from models import Registro, Proyecto, Indicadores # Importa las clases que se van a probar.
 
 # --- Clase de Pruebas para la clase Registro ---
 
@@ -86,4 +86,58 @@ class TestRegistro:
                                        costo_estimado=3000.0, costo_real=2800.0, # Sobrecosto: -200 (ahorro)
                                        avance_estimado=100.0, avance_real=100.0,
                                        trabajadores=6)
-        assert registro_con_ahorro.sobrecosto() == -200.0
\ No newline at end of file
+        assert registro_con_ahorro.sobrecosto() == -200.0
+
+# --- Clase de Pruebas para la clase Proyecto ---
+
+class TestProyecto:
+    """
+    Clase que agrupa pruebas unitarias para la clase `Proyecto`.
+    """
+
+    def test_alertas_proyecto_coinciden_con_alertas_por_registro(self):
+        """
+        Verifica que las alertas calculadas en bloque sean las mismas que devuelve
+        `alerta_sobreuso_recursos` registro a registro, incluidos los casos borde
+        (costo estimado 0 o negativo, avance estimado 0) y umbrales personalizados.
+        """
+        registros = [
+            Registro(1, "P1", "Diseño", "E1", 100.0, 130.0, 100.0, 70.0, 2),
+            Registro(2, "P1", "Diseño", "E2", 0.0, 50.0, 0.0, 10.0, 3),
+            Registro(3, "P1", "Terreno", "E1", -10.0, -5.0, 100.0, 100.0, 1),
+            Registro(4, "P1", "Terreno", "E2", 200.0, 210.0, 80.0, 60.0, 4),
+        ]
+        proyecto = Proyecto("P1")
+        for r in registros:
+            proyecto.agregar_registro(r)
+
+        for umbrales in ({}, {"umbral_sobrecosto_porcentual": 1.0, "umbral_baja_eficiencia": 50.0}):
+            esperado = {
+                f"Reg.ID {r.id} (Eq:{r.equipo}, Área:{r.area})": r.alerta_sobreuso_recursos(**umbrales)
+                for r in registros if r.alerta_sobreuso_recursos(**umbrales)
+            }
+            assert proyecto.obtener_alertas_proyecto(**umbrales) == esperado
+        assert list(proyecto.areas["Diseño"].obtener_alertas_area()) == ["Reg.ID 1 (Proy:P1, Eq:E1)", "Reg.ID 2 (Proy:P1, Eq:E2)"]
+
+
+# --- Clase de Pruebas para la clase Indicadores ---
+
+class TestIndicadores:
+    """
+    Clase que agrupa pruebas unitarias para la clase `Indicadores`.
+    """
+
+    def test_eficiencia_general_vec_coincide_con_version_objetos(self):
+        """
+        Verifica que la versión vectorizada entregue el mismo resultado que
+        `eficiencia_general`, ignorando los registros con avance_estimado igual a 0.
+        """
+        avance_real = np.array([80.0, 50.0, 30.0, np.nan])
+        avance_estimado = np.array([100.0, 0.0, 60.0, 40.0])
+        registros = [
+            Registro(i, "P", "A", "E", 1.0, 1.0, est, real, 1)
+            for i, (real, est) in enumerate(zip(avance_real, avance_estimado))
+        ]
+        esperado = Indicadores.eficiencia_general(registros)
+        assert Indicadores.eficiencia_general_vec(avance_real, avance_estimado) == pytest.approx(esperado)
+        assert Indicadores.eficiencia_general_vec(np.array([10.0]), np.array([0.0])) == 0.0
@@ -0,0 +1,60 @@
+import pytest
+import sys
+import os
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg") # Backend sin ventana: las pruebas no abren gráficos.
+import matplotlib.pyplot as plt
+
+
+# Agrega el directorio padre al sys.path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from visualizador_dinamico import generar_graficos_dinamicos # Importa la función que se va a probar.
+
+# --- Clase de Pruebas para generar_graficos_dinamicos ---
+
+class TestGenerarGraficosDinamicos:
+    """
+    Clase que agrupa pruebas unitarias para `generar_graficos_dinamicos`.
+    """
+
+    def test_reutiliza_figura_existente(self):
+        """
+        Verifica que una figura pasada en `fig` se limpie, se redimensione según la grilla
+        de gráficos y sea la misma que se devuelve.
+        """
+        df = pd.DataFrame({"costo": [10.0, 12.5, 11.0, 30.0, 14.2, 9.8]})
+        fig = plt.figure(figsize=(10, 10))
+        eje_anterior = fig.add_subplot()
+        eje_anterior.set_title("gráfico anterior")
+
+        try:
+            fig_resultado, recomendaciones, rutas = generar_graficos_dinamicos(
+                df, "costo", base_figsize_w=3.0, base_figsize_h=2.0, fig=fig)
+
+            assert fig_resultado is fig
+            assert eje_anterior not in fig.axes
+            assert len(fig.axes) == len(recomendaciones) == 2 # Histograma y boxplot, grilla 2x1.
+            assert tuple(fig.get_size_inches()) == pytest.approx((6.0, 2.0))
+            assert rutas == []
+        finally:
+            plt.close(fig)
+
+    def test_figura_reutilizada_igual_a_figura_nueva(self):
+        """
+        Verifica que los márgenes que dejó un dibujo anterior no cambien la disposición:
+        los ejes quedan en la misma posición que al dibujar sobre una figura nueva.
+        """
+        df = pd.DataFrame({"costo": [10.0, 12.5, 11.0, 30.0, 14.2, 9.8]})
+        fig_reutilizada = plt.figure()
+        fig_reutilizada.subplots_adjust(left=0.4, top=0.5) # Márgenes de un dibujo anterior.
+
+        try:
+            fig_nueva, _, _ = generar_graficos_dinamicos(df, "costo")
+            generar_graficos_dinamicos(df, "costo", fig=fig_reutilizada)
+
+            posiciones = lambda fig: [tuple(ax.get_position().bounds) for ax in fig.axes]
+            assert posiciones(fig_reutilizada) == pytest.approx(posiciones(fig_nueva))
+        finally:
+            plt.close("all")
@@ -4,6 +4,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 from datetime import datetime
+from typing import Optional
 
 def _identificar_tipo_variable(series: pd.Series) -> str:
     """
@@ -275,9 +276,29 @@ class GestorDeGraficos:
     def generar_visualizaciones(self, col1_name: str, col2_name: str = None,
                                 export_dir: str = "graficos_exportados", show_plot: bool = True,
                                 base_figsize_w: float = 3.5,
-                                base_figsize_h: float = 2.8
+                                base_figsize_h: float = 2.8,
+                                fig: Optional[plt.Figure] = None
                                ) -> tuple:
-       
+        """
+        Genera la grilla de gráficos recomendados para una columna o par de columnas.
+
+        col1_name (str): Nombre de la primera columna a graficar.
+        col2_name (str, optional): Nombre de la segunda columna para gráficos bivariados. Defaults to None.
+        export_dir (str, optional): Directorio donde se guarda la figura en PNG. Si es None o vacío,
+                                    no se exporta. Defaults to "graficos_exportados".
+        show_plot (bool, optional): Si es True, muestra la figura con `plt.show()`. Defaults to True.
+        base_figsize_w (float, optional): Ancho en pulgadas de cada subgráfico. Defaults to 3.5.
+        base_figsize_h (float, optional): Alto en pulgadas de cada subgráfico. Defaults to 2.8.
+        fig (Optional[plt.Figure], optional): Figura existente a reutilizar. Se limpia y se redimensiona
+                                    en lugar de crear una nueva (la creación de figuras es la
+                                    parte más costosa en gráficos pequeños). Defaults to None.
+
+        tuple: Una tupla (figura, recomendaciones, rutas):
+                   - La figura de Matplotlib con los gráficos (la misma `fig` si se pasó una),
+                     o None si no hay recomendaciones.
+                   - La lista de configuraciones de gráficos recomendados.
+                   - La lista de rutas de los archivos exportados.
+        """
         recomendaciones = self._obtener_recomendaciones(col1_name, col2_name)
 
         if not recomendaciones:
@@ -297,7 +318,16 @@ class GestorDeGraficos:
         fig_width = base_figsize_w * ncols
         fig_height = base_figsize_h * nrows
 
-        fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=(fig_width, fig_height), squeeze=False)
+        if fig is None:
+            fig, axes = plt.subplots(nrows=nrows, ncols=ncols, figsize=(fig_width, fig_height), squeeze=False)
+        else:
+            fig.clear()
+            # clear() conserva los márgenes que dejó el tight_layout anterior; se restauran los
+            # valores por defecto para que el resultado sea igual al de una figura nueva.
+            fig.subplots_adjust(**{k: plt.rcParams[f"figure.subplot.{k}"]
+                                   for k in ("left", "bottom", "right", "top", "wspace", "hspace")})
+            fig.set_size_inches(fig_width, fig_height)
+            axes = fig.subplots(nrows=nrows, ncols=ncols, squeeze=False)
         axes_flat = axes.flatten() # Facilita iterar sobre los ejes
         file_paths = []
 
@@ -341,7 +371,7 @@ class GestorDeGraficos:
         for j in range(i + 1, len(axes_flat)):
             axes_flat[j].set_visible(False)
 
-        plt.tight_layout(pad=0.7, h_pad=1.2 if nrows > 1 else 0.7, w_pad=0.7)
+        fig.tight_layout(pad=0.7, h_pad=1.2 if nrows > 1 else 0.7, w_pad=0.7)
 
         if export_dir:
             _crear_directorio_si_no_existe(export_dir)
@@ -366,12 +396,31 @@ def generar_graficos_dinamicos(df: pd.DataFrame, col1_name: str, col2_name: str
                                export_dir: str = None,
                                show_plot: bool = False,
                                base_figsize_w: float = 3.5,
-                               base_figsize_h: float = 2.8
+                               base_figsize_h: float = 2.8,
+                               fig: Optional[plt.Figure] = None
                               ) -> tuple:
- 
+    """
+    Función de conveniencia que crea un GestorDeGraficos y genera los gráficos
+    recomendados para una columna o par de columnas de `df`.
+
+    df (pd.DataFrame): El DataFrame con los datos a graficar.
+    col1_name (str): Nombre de la primera columna a graficar.
+    col2_name (str, optional): Nombre de la segunda columna para gráficos bivariados. Defaults to None.
+    export_dir (str, optional): Directorio donde se guarda la figura en PNG. Si es None,
+                                no se exporta. Defaults to None.
+    show_plot (bool, optional): Si es True, muestra la figura con `plt.show()`. Defaults to False.
+    base_figsize_w (float, optional): Ancho en pulgadas de cada subgráfico. Defaults to 3.5.
+    base_figsize_h (float, optional): Alto en pulgadas de cada subgráfico. Defaults to 2.8.
+    fig (Optional[plt.Figure], optional): Figura existente a reutilizar; se limpia y se
+                                          redimensiona. Defaults to None.
+
+    tuple: Una tupla (figura, recomendaciones, rutas) como la de
+               `GestorDeGraficos.generar_visualizaciones`, o (None, [], []) si `df`
+               no es un DataFrame o está vacío.
+    """
     if not isinstance(df, pd.DataFrame) or df.empty:
         print("Error: Se requiere un DataFrame de Pandas no vacío.")
         return None, [], []
 
     manager = GestorDeGraficos(df)
-    return manager.generar_visualizaciones(col1_name, col2_name, export_dir, show_plot, base_figsize_w, base_figsize_h)
+    return manager.generar_visualizaciones(col1_name, col2_name, export_dir, show_plot, base_figsize_w, base_figsize_h, fig)